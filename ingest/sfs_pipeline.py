@@ -6,6 +6,7 @@ Kommandon:
   normalize --all            Normaliserar alla rådata i data/raw/sfs/
   normalize --sfs 2017:900   Normaliserar ett enskilt SFS-nummer
   normalize --limit N        Normaliserar max N dokument (test)
+  normalize ... --workers N  Parsar/chunkar dokument i N parallella processer
   verify                     Verifierar normaliserad data
   stats                      Visar statistik över normaliserade filer
 
@@ -13,6 +14,7 @@ Användning:
   python3 sfs_pipeline.py normalize --all
   python3 sfs_pipeline.py normalize --sfs 2017:900
   python3 sfs_pipeline.py normalize --limit 100
+  python3 sfs_pipeline.py normalize --all --workers 8
   python3 sfs_pipeline.py stats
   python3 sfs_pipeline.py verify
 """
@@ -23,6 +25,8 @@ import json
 import time
 import argparse
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -199,28 +203,32 @@ def cmd_normalize(args):
     total_chunks = 0
     errors_log = []
 
-    logger.info(f"Startar normalisering av {total} filer ...")
+    # process_one är en ren funktion per fil (läser rådata, skriver egen norm-fil), så den kan
+    # köras i separata processer; map() behåller filordningen för progress och felrapport
+    workers = max(1, min(args.workers or 1, total))
+    logger.info(f"Startar normalisering av {total} filer ({workers} processer) ...")
     t_start = time.time()
 
-    for i, path in enumerate(files, 1):
-        result = process_one(path)
-        s = result["status"]
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as pool:
+        results = pool.map(process_one, files, chunksize=8) if pool else map(process_one, files)
+        for i, result in enumerate(results, 1):
+            s = result["status"]
 
-        if s == "OK":     ok += 1
-        elif s == "WARN": warn += 1; errors_log.append(result)
-        elif s == "SKIP": skip += 1
-        else:             fail += 1; errors_log.append(result)
+            if s == "OK":     ok += 1
+            elif s == "WARN": warn += 1; errors_log.append(result)
+            elif s == "SKIP": skip += 1
+            else:             fail += 1; errors_log.append(result)
 
-        total_chunks += result["chunks"]
+            total_chunks += result["chunks"]
 
-        if i % 100 == 0 or i == total:
-            elapsed = time.time() - t_start
-            rate = i / elapsed if elapsed > 0 else 0
-            eta_s = (total - i) / rate if rate > 0 else 0
-            logger.info(
-                f"  {i:5d}/{total}  OK={ok} WARN={warn} SKIP={skip} FAIL={fail} "
-                f"chunks={total_chunks:,}  {rate:.0f} dok/s  ETA {eta_s/60:.1f} min"
-            )
+            if i % 100 == 0 or i == total:
+                elapsed = time.time() - t_start
+                rate = i / elapsed if elapsed > 0 else 0
+                eta_s = (total - i) / rate if rate > 0 else 0
+                logger.info(
+                    f"  {i:5d}/{total}  OK={ok} WARN={warn} SKIP={skip} FAIL={fail} "
+                    f"chunks={total_chunks:,}  {rate:.0f} dok/s  ETA {eta_s/60:.1f} min"
+                )
 
     elapsed_total = time.time() - t_start
 
@@ -331,6 +339,10 @@ def main():
     grp.add_argument("--all",  action="store_true", help="Normalisera alla filer")
     grp.add_argument("--sfs",  metavar="SFS_NR",    help="Enskilt SFS-nummer, t.ex. 2017:900")
     p_norm.add_argument("--limit", metavar="N", type=int, help="Max antal filer (test)")
+    p_norm.add_argument(
+        "--workers", metavar="N", type=int, default=1,
+        help="Antal parallella processer (default 1 = sekventiellt)",
+    )
 
     sub.add_parser("stats",  help="Visa statistik")
     sub.add_parser("verify", help="Verifiera normaliserade filer")
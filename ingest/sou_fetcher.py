@@ -2,34 +2,56 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import json
 import logging
+import math
 from pathlib import Path
 import re
 import time
-from typing import Any
+from typing import Any, Iterator
+from urllib.parse import urlsplit
 
 import requests
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger("paragrafenai.noop")
 
+# Upper bound for server-provided Retry-After so a misbehaving header cannot stall the run.
+MAX_RETRY_AFTER_S = 120.0
+
 
 class FetchError(Exception):
     """Raised when an HTTP request fails after retries."""
 
 
-def load_sources_config(config_path: str | Path = "config/sources.yaml") -> dict[str, Any]:
-    """Load ingest source config from YAML."""
-    path = Path(config_path)
-    with path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+@lru_cache(maxsize=4)
+def _load_sources_config_cached(resolved_path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(resolved_path, "r", encoding="utf-8") as fh:
+        data = yaml.load(fh, Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise ValueError("Config root must be a mapping.")
     return data
 
 
+def load_sources_config(config_path: str | Path = "config/sources.yaml") -> dict[str, Any]:
+    """Load ingest source config from YAML.
+
+    Parsed configs are cached per resolved path and mtime; treat the result as read-only.
+    """
+    path = Path(config_path).resolve()
+    return _load_sources_config_cached(str(path), path.stat().st_mtime_ns)
+
+
 def normalize_sou_beteckning(beteckning: str, rm: str = "", nummer: str = "", dok_id: str = "") -> str | None:
     """Normalize SOU beteckning to 'SOU_YYYY_NNN' format.
 
@@ -64,9 +86,9 @@ def normalize_sou_beteckning(beteckning: str, rm: str = "", nummer: str = "", do
     return base
 
 
+# Both writers expect fetch_sou_documents to have created the target directories up front.
 def _append_error(errors_path: Path, payload: dict[str, Any]) -> None:
     try:
-        errors_path.parent.mkdir(parents=True, exist_ok=True)
         with errors_path.open("a", encoding="utf-8") as fh:
             fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
     except OSError as exc:
@@ -76,9 +98,8 @@ def _append_error(errors_path: Path, payload: dict[str, Any]) -> None:
 
 def _write_json_file(path: Path, payload: dict[str, Any]) -> None:
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as fh:
-            json.dump(payload, fh, ensure_ascii=False, indent=2)
+            fh.write(json.dumps(payload, ensure_ascii=False, indent=2))
     except OSError as exc:
         logger.critical("Failed writing output file %s: %s", path, exc)
         raise SystemExit(1) from exc
@@ -118,6 +139,28 @@ def _extract_remaining(list_payload: dict[str, Any]) -> int | None:
     return None
 
 
+def _retry_delay(exc: Exception, attempt: int, retry_backoff_base_s: float) -> float:
+    """Backoff before the next attempt, honouring Retry-After on 429/503 responses."""
+    backoff = retry_backoff_base_s * (2 ** (attempt - 1))
+    response = getattr(exc, "response", None)
+    if response is None or response.status_code not in (429, 503):
+        return backoff
+    retry_after = (response.headers.get("Retry-After") or "").strip()
+    if not retry_after:
+        return backoff
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return backoff
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER_S)
+
+
 def _request_with_retry(
     session: requests.Session,
     *,
@@ -138,7 +181,7 @@ def _request_with_retry(
             last_exc = exc
             if attempt >= max_retries:
                 break
-            time.sleep(retry_backoff_base_s * (2 ** (attempt - 1)))
+            time.sleep(_retry_delay(exc, attempt, retry_backoff_base_s))
     raise FetchError(str(last_exc) if last_exc else "Unknown request failure")
 
 
@@ -165,15 +208,74 @@ def _request_json_with_retry(
             last_exc = exc
             if attempt >= max_retries:
                 break
-            time.sleep(retry_backoff_base_s * (2 ** (attempt - 1)))
+            time.sleep(_retry_delay(exc, attempt, retry_backoff_base_s))
     raise FetchError(str(last_exc) if last_exc else "Unknown JSON request failure")
 
 
+_TEXTUAL_CONTENT_TOKENS = ("text", "html", "xml")
+_SNIFF_RANGE = "bytes=0-2047"
+# Only filUrls ending in one of these are probed; any other URL goes straight to the full GET,
+# so the probe replaces a request instead of adding an unpaced one per document.
+_BINARY_URL_SUFFIXES = (".pdf", ".doc", ".docx", ".rtf", ".zip")
+
+
+def _is_textual_content_type(content_type: str) -> bool:
+    content_type = content_type.lower()
+    return any(token in content_type for token in _TEXTUAL_CONTENT_TOKENS)
+
+
+def _looks_like_binary_url(url: str) -> bool:
+    return urlsplit(url).path.lower().endswith(_BINARY_URL_SUFFIXES)
+
+
+def _sniff_is_binary(
+    session: requests.Session,
+    *,
+    url: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> bool:
+    """Return True when a ranged probe shows *url* is non-textual.
+
+    Any failure returns False so the caller falls back to the regular full GET.
+    """
+    try:
+        response = session.get(
+            url,
+            headers={**headers, "Range": _SNIFF_RANGE},
+            timeout=timeout,
+            stream=True,
+        )
+    except (requests.Timeout, requests.ConnectionError):
+        return False
+    try:
+        if response.status_code >= 400:
+            return False
+        content_type = response.headers.get("Content-Type", "")
+        return bool(content_type) and not _is_textual_content_type(content_type)
+    finally:
+        response.close()
+
+
+def _response_text(response: requests.Response) -> str:
+    # Riksdagen serves UTF-8; pinning the encoding skips requests' charset detection pass.
+    if not response.encoding:
+        response.encoding = "utf-8"
+    return response.text
+
+
+def _get_str(document: dict[str, Any], key: str) -> str:
+    value = document.get(key)
+    if isinstance(value, str):
+        return value.strip()
+    return ""
+
+
 def _first_non_empty(document: dict[str, Any], *keys: str) -> str:
     for key in keys:
-        value = document.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+        value = _get_str(document, key)
+        if value:
+            return value
     return ""
 
 
@@ -181,37 +283,343 @@ def _join_url(base_url: str, endpoint: str) -> str:
     return f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
 
+def _split_dok_id_template(base_url: str, template: str) -> tuple[str, str]:
+    """Pre-split the document URL around ``{dok_id}`` so per-doc URLs are plain concatenation."""
+    prefix, placeholder, suffix = _join_url(base_url, template).partition("{dok_id}")
+    if not placeholder:
+        raise ValueError("document_html_endpoint must contain '{dok_id}'.")
+    return prefix, suffix
+
+
+@dataclass(frozen=True, slots=True)
+class SouFetchConfig:
+    """Typed view of the SOU-relevant parts of ``sources.yaml``, built once per run."""
+
+    list_url: str
+    html_prefix: str
+    html_suffix: str
+    list_params: dict[str, Any]
+    output_dir: Path
+    errors_path: Path
+    headers: dict[str, str]
+    delay_between: float
+    max_retries: int
+    retry_backoff_base_s: float
+    timeout: float
+    max_workers: int
+    log_every: int
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SouFetchConfig:
+        api_cfg = config["riksdagen_api"]
+        sou_cfg = api_cfg["sou"]
+        rate_cfg = config.get("rate_limiting", {})
+        http_cfg = config.get("http", {})
+        progress_cfg = config.get("progress", {})
+
+        base_url = str(api_cfg["base_url"])
+        html_prefix, html_suffix = _split_dok_id_template(
+            base_url, str(sou_cfg["document_html_endpoint"])
+        )
+        return cls(
+            list_url=_join_url(base_url, str(sou_cfg["list_endpoint"])),
+            html_prefix=html_prefix,
+            html_suffix=html_suffix,
+            list_params={
+                "doktyp": sou_cfg["doktyp"],
+                "utformat": sou_cfg["utformat"],
+                "pagesize": sou_cfg["pagesize"],
+            },
+            output_dir=Path(str(sou_cfg["output_dir"])),
+            errors_path=Path(str(sou_cfg["errors_file"])),
+            headers={
+                "User-Agent": str(http_cfg.get("user_agent", "paragrafenai-fetcher/0.1")),
+                "Accept-Encoding": str(http_cfg.get("accept_encoding", "gzip, deflate")),
+            },
+            delay_between=float(rate_cfg.get("delay_between_requests_s", 1.0)),
+            max_retries=int(rate_cfg.get("max_retries", 3)),
+            retry_backoff_base_s=float(rate_cfg.get("retry_backoff_base_s", 1.0)),
+            timeout=float(rate_cfg.get("request_timeout_s", 30)),
+            max_workers=int(rate_cfg.get("max_concurrent_documents", 1)),
+            log_every=int(progress_cfg.get("log_every_n_documents", 100)),
+        )
+
+    def html_url(self, dok_id: str) -> str:
+        return f"{self.html_prefix}{dok_id}{self.html_suffix}"
+
+
+@dataclass
+class _SouCandidate:
+    out_name: str
+    beteckning: str
+    dok_id: str
+    titel: str
+    datum: str
+    organ: str
+    fil_url: str
+    rm: str
+    nummer: str
+
+
+@dataclass
+class _SouFetchResult:
+    source_url: str
+    html_content: str = ""
+    html_available: bool = False
+    any_fetch_success: bool = False
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _fetch_document_content(
+    session: requests.Session,
+    cfg: SouFetchConfig,
+    candidate: _SouCandidate,
+) -> _SouFetchResult:
+    """Fetch HTML for one SOU, falling back to filUrl. Safe to run in a worker thread.
+
+    Errors are collected on the result instead of written, so the caller owns all file IO.
+    """
+    dok_id = candidate.dok_id
+    fil_url = candidate.fil_url
+    result = _SouFetchResult(source_url=fil_url)
+
+    if dok_id:
+        html_url = cfg.html_url(dok_id)
+        try:
+            response = _request_with_retry(
+                session,
+                url=html_url,
+                headers=cfg.headers,
+                params=None,
+                timeout=cfg.timeout,
+                max_retries=cfg.max_retries,
+                retry_backoff_base_s=cfg.retry_backoff_base_s,
+            )
+            result.any_fetch_success = True
+            result.source_url = html_url
+            maybe_text = _response_text(response).strip()
+            if maybe_text:
+                result.html_content = maybe_text
+                result.html_available = True
+        except FetchError as exc:
+            logger.warning("Failed HTML fetch for SOU dok_id=%s: %s", dok_id, exc)
+            result.errors.append(
+                {
+                    "source": "sou_document_html",
+                    "dok_id": dok_id,
+                    "beteckning": candidate.beteckning,
+                    "error": str(exc),
+                    "fetched_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+
+    if (
+        not result.html_available
+        and fil_url
+        and _looks_like_binary_url(fil_url)
+        and _sniff_is_binary(session, url=fil_url, headers=cfg.headers, timeout=cfg.timeout)
+    ):
+        result.any_fetch_success = True
+        result.source_url = fil_url
+    elif not result.html_available and fil_url:
+        try:
+            response = _request_with_retry(
+                session,
+                url=fil_url,
+                headers=cfg.headers,
+                params=None,
+                timeout=cfg.timeout,
+                max_retries=cfg.max_retries,
+                retry_backoff_base_s=cfg.retry_backoff_base_s,
+            )
+            result.any_fetch_success = True
+            result.source_url = fil_url
+            if _is_textual_content_type(response.headers.get("Content-Type", "")):
+                maybe_text = _response_text(response).strip()
+                if maybe_text:
+                    result.html_content = maybe_text
+                    result.html_available = True
+        except FetchError as exc:
+            logger.warning("Fallback fetch failed for SOU dok_id=%s: %s", dok_id, exc)
+            result.errors.append(
+                {
+                    "source": "sou_document_fallback",
+                    "dok_id": dok_id,
+                    "beteckning": candidate.beteckning,
+                    "error": str(exc),
+                    "fetched_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+
+    return result
+
+
+def _store_document(
+    out_path: Path,
+    errors_path: Path,
+    candidate: _SouCandidate,
+    result: _SouFetchResult,
+) -> bool:
+    """Record fetch errors and write the raw payload. Returns True when a file was written."""
+    for error in result.errors:
+        _append_error(errors_path, error)
+
+    dok_id = candidate.dok_id
+    fil_url = candidate.fil_url
+    beteckning = candidate.beteckning
+
+    if not result.any_fetch_success and (dok_id or fil_url):
+        logger.error("Could not fetch SOU content after retries for dok_id=%s", dok_id)
+        _append_error(
+            errors_path,
+            {
+                "source": "sou_document",
+                "dok_id": dok_id,
+                "beteckning": beteckning,
+                "error": "Could not fetch content after retries.",
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        return False
+
+    if not result.html_available and not fil_url and not dok_id:
+        logger.error("SOU document missing filUrl and dok_id: %s", beteckning)
+        _append_error(
+            errors_path,
+            {
+                "source": "sou_document",
+                "beteckning": beteckning,
+                "error": "Missing filUrl and dok_id.",
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        return False
+
+    rm = candidate.rm
+    nummer_field = candidate.nummer
+    raw_payload: dict[str, Any] = {
+        "beteckning": f"SOU {rm}:{nummer_field}" if rm and nummer_field else beteckning,
+        "dok_id": dok_id,
+        "titel": candidate.titel,
+        "datum": candidate.datum,
+        "organ": candidate.organ,
+        "source_url": result.source_url,
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if result.html_available:
+        raw_payload["html_content"] = result.html_content
+    else:
+        raw_payload["html_available"] = False
+
+    _write_json_file(out_path, raw_payload)
+    return True
+
+
+def _fetch_list_page(
+    session: requests.Session, cfg: SouFetchConfig, page: int
+) -> tuple[list[dict[str, Any]], int | None]:
+    page_payload = _request_json_with_retry(
+        session,
+        url=cfg.list_url,
+        headers=cfg.headers,
+        params={**cfg.list_params, "p": page},
+        timeout=cfg.timeout,
+        max_retries=cfg.max_retries,
+        retry_backoff_base_s=cfg.retry_backoff_base_s,
+    )
+    # Only the document list and the remaining counter are needed; the rest of the payload
+    # is dropped here instead of being held through the slow per-document fetch loop.
+    return _extract_documents(page_payload), _extract_remaining(page_payload)
+
+
+def _record_list_error(cfg: SouFetchConfig, page: int, exc: FetchError) -> None:
+    logger.error("Failed to fetch SOU list page %s: %s", page, exc)
+    _append_error(
+        cfg.errors_path,
+        {
+            "source": "sou_list",
+            "page": page,
+            "error": str(exc),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+
+
+def _is_last_page(documents: list[dict[str, Any]], remaining: int | None) -> bool:
+    return remaining == 0 or (remaining is None and not documents)
+
+
+def _iter_list_pages(
+    session: requests.Session, cfg: SouFetchConfig
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield the documents of each SOU list page until ``@återstående`` reaches zero.
+
+    With ``max_workers > 1`` the page count is derived from page 1 and the remaining pages
+    are requested concurrently, then yielded in page order. A failed page ends iteration.
+    """
+    page = 1
+    while True:
+        try:
+            documents, remaining = _fetch_list_page(session, cfg, page)
+        except FetchError as exc:
+            _record_list_error(cfg, page, exc)
+            return
+        yield documents
+        if _is_last_page(documents, remaining):
+            return
+
+        pagesize = int(cfg.list_params.get("pagesize") or 0)
+        if page == 1 and cfg.max_workers > 1 and remaining and pagesize > 0:
+            last_page = 1 + math.ceil(remaining / pagesize)
+            with ThreadPoolExecutor(max_workers=cfg.max_workers) as executor:
+                futures = {
+                    number: executor.submit(_fetch_list_page, session, cfg, number)
+                    for number in range(2, last_page + 1)
+                }
+                for number, future in futures.items():
+                    try:
+                        documents, remaining = future.result()
+                    except FetchError as exc:
+                        _record_list_error(cfg, number, exc)
+                        executor.shutdown(cancel_futures=True)
+                        return
+                    yield documents
+                    if _is_last_page(documents, remaining):
+                        executor.shutdown(cancel_futures=True)
+                        return
+            # The listing grew while we were paging; continue sequentially from here.
+            page = last_page
+
+        page += 1
+
+
+def _first_candidate_per_name(
+    candidates: list[_SouCandidate], existing: set[str]
+) -> tuple[list[_SouCandidate], list[_SouCandidate]]:
+    """Split off the first candidate per output name not yet in *existing*; return it and the rest."""
+    pending: set[str] = set()
+    first: list[_SouCandidate] = []
+    later: list[_SouCandidate] = []
+    for candidate in candidates:
+        if candidate.out_name in existing:
+            continue
+        if candidate.out_name in pending:
+            later.append(candidate)
+        else:
+            pending.add(candidate.out_name)
+            first.append(candidate)
+    return first, later
+
+
 def fetch_sou_documents(
     config_path: str | Path = "config/sources.yaml",
     *,
     session: requests.Session | None = None,
 ) -> int:
     """Fetch all SOU documents and store one raw JSON file per document."""
-    config = load_sources_config(config_path)
-    api_cfg = config["riksdagen_api"]
-    sou_cfg = api_cfg["sou"]
-    rate_cfg = config.get("rate_limiting", {})
-    http_cfg = config.get("http", {})
-    progress_cfg = config.get("progress", {})
-
-    base_url = str(api_cfg["base_url"])
-    list_url = _join_url(base_url, str(sou_cfg["list_endpoint"]))
-    html_template = str(sou_cfg["document_html_endpoint"])
-
-    output_dir = Path(str(sou_cfg["output_dir"]))
-    errors_path = Path(str(sou_cfg["errors_file"]))
-
-    delay_between = float(rate_cfg.get("delay_between_requests_s", 1.0))
-    max_retries = int(rate_cfg.get("max_retries", 3))
-    retry_backoff_base_s = float(rate_cfg.get("retry_backoff_base_s", 1.0))
-    timeout = float(rate_cfg.get("request_timeout_s", 30))
-
-    log_every = int(progress_cfg.get("log_every_n_documents", 100))
-
-    headers = {
-        "User-Agent": str(http_cfg.get("user_agent", "paragrafenai-fetcher/0.1")),
-        "Accept-Encoding": str(http_cfg.get("accept_encoding", "gzip, deflate")),
-    }
+    cfg = SouFetchConfig.from_config(load_sources_config(config_path))
+    output_dir = cfg.output_dir
+    errors_path = cfg.errors_path
 
     if session is None:
         session = requests.Session()
@@ -219,50 +627,24 @@ def fetch_sou_documents(
     output_dir.mkdir(parents=True, exist_ok=True)
     errors_path.parent.mkdir(parents=True, exist_ok=True)
 
-    saved_count = 0
-    page = 1
-    while True:
-        params: dict[str, Any] = {
-            "doktyp": sou_cfg["doktyp"],
-            "utformat": sou_cfg["utformat"],
-            "pagesize": sou_cfg["pagesize"],
-            "p": page,
-        }
+    # Snapshot existing outputs once; resumed runs would otherwise stat() every candidate.
+    existing = {path.name for path in output_dir.iterdir() if path.suffix == ".json"}
 
-        try:
-            page_payload = _request_json_with_retry(
-                session,
-                url=list_url,
-                headers=headers,
-                params=params,
-                timeout=timeout,
-                max_retries=max_retries,
-                retry_backoff_base_s=retry_backoff_base_s,
-            )
-        except FetchError as exc:
-            logger.error("Failed to fetch SOU list page %s: %s", page, exc)
-            _append_error(
-                errors_path,
-                {
-                    "source": "sou_list",
-                    "page": page,
-                    "error": str(exc),
-                    "fetched_at": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-            break
+    def fetch_and_pace(candidate: _SouCandidate) -> _SouFetchResult:
+        # Each worker keeps the configured per-request delay, so the request rate is
+        # bounded by max_workers / delay_between_requests_s.
+        result = _fetch_document_content(session, cfg, candidate)
+        time.sleep(cfg.delay_between)
+        return result
 
-        documents = _extract_documents(page_payload)
+    saved_count = 0
+    for documents in _iter_list_pages(session, cfg):
+        candidates: list[_SouCandidate] = []
         for document in documents:
-            beteckning = _first_non_empty(document, "beteckning")
+            beteckning = _get_str(document, "beteckning")
             dok_id = _first_non_empty(document, "dok_id", "id")
-            titel = _first_non_empty(document, "titel")
-            datum = _first_non_empty(document, "datum")
-            organ = _first_non_empty(document, "organ")
-            fil_url = _first_non_empty(document, "filUrl", "fil_url")
-
-            rm = _first_non_empty(document, "rm")
-            nummer_field = _first_non_empty(document, "nummer")
+            rm = _get_str(document, "rm")
+            nummer_field = _get_str(document, "nummer")
             normalized_name = normalize_sou_beteckning(beteckning, rm=rm or "", nummer=nummer_field or "", dok_id=dok_id or "")
             if not normalized_name:
                 if dok_id:
@@ -283,134 +665,57 @@ def fetch_sou_documents(
                     )
                     continue
 
-            out_path = output_dir / f"{normalized_name}.json"
-            if out_path.exists():
-                continue
-
-            source_url = fil_url
-            html_content = ""
-            html_available = False
-            any_fetch_success = False
-            html_url = ""
-
-            if dok_id:
-                html_url = _join_url(base_url, html_template.format(dok_id=dok_id))
-                try:
-                    response = _request_with_retry(
-                        session,
-                        url=html_url,
-                        headers=headers,
-                        params=None,
-                        timeout=timeout,
-                        max_retries=max_retries,
-                        retry_backoff_base_s=retry_backoff_base_s,
-                    )
-                    any_fetch_success = True
-                    source_url = html_url
-                    maybe_text = response.text.strip()
-                    if maybe_text:
-                        html_content = maybe_text
-                        html_available = True
-                except FetchError as exc:
-                    logger.warning("Failed HTML fetch for SOU dok_id=%s: %s", dok_id, exc)
-                    _append_error(
-                        errors_path,
-                        {
-                            "source": "sou_document_html",
-                            "dok_id": dok_id,
-                            "beteckning": beteckning,
-                            "error": str(exc),
-                            "fetched_at": datetime.now(timezone.utc).isoformat(),
-                        },
-                    )
-
-            if not html_available and fil_url:
-                try:
-                    response = _request_with_retry(
-                        session,
-                        url=fil_url,
-                        headers=headers,
-                        params=None,
-                        timeout=timeout,
-                        max_retries=max_retries,
-                        retry_backoff_base_s=retry_backoff_base_s,
-                    )
-                    any_fetch_success = True
-                    source_url = fil_url
-                    content_type = response.headers.get("Content-Type", "").lower()
-                    if any(token in content_type for token in ("text", "html", "xml")):
-                        maybe_text = response.text.strip()
-                        if maybe_text:
-                            html_content = maybe_text
-                            html_available = True
-                except FetchError as exc:
-                    logger.warning("Fallback fetch failed for SOU dok_id=%s: %s", dok_id, exc)
-                    _append_error(
-                        errors_path,
-                        {
-                            "source": "sou_document_fallback",
-                            "dok_id": dok_id,
-                            "beteckning": beteckning,
-                            "error": str(exc),
-                            "fetched_at": datetime.now(timezone.utc).isoformat(),
-                        },
-                    )
-
-            if not any_fetch_success and (dok_id or fil_url):
-                logger.error("Could not fetch SOU content after retries for dok_id=%s", dok_id)
-                _append_error(
-                    errors_path,
-                    {
-                        "source": "sou_document",
-                        "dok_id": dok_id,
-                        "beteckning": beteckning,
-                        "error": "Could not fetch content after retries.",
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
+            out_name = f"{normalized_name}.json"
+            if out_name in existing:
                 continue
-
-            if not html_available and not fil_url and not dok_id:
-                logger.error("SOU document missing filUrl and dok_id: %s", beteckning)
-                _append_error(
-                    errors_path,
-                    {
-                        "source": "sou_document",
-                        "beteckning": beteckning,
-                        "error": "Missing filUrl and dok_id.",
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    },
+            candidates.append(
+                _SouCandidate(
+                    out_name=out_name,
+                    beteckning=beteckning,
+                    dok_id=dok_id,
+                    titel=_get_str(document, "titel"),
+                    datum=_get_str(document, "datum"),
+                    organ=_get_str(document, "organ"),
+                    fil_url=_first_non_empty(document, "filUrl", "fil_url"),
+                    rm=rm,
+                    nummer=nummer_field,
                 )
-                continue
-
-            raw_payload: dict[str, Any] = {
-                "beteckning": f"SOU {rm}:{nummer_field}" if rm and nummer_field else beteckning,
-                "dok_id": dok_id,
-                "titel": titel,
-                "datum": datum,
-                "organ": organ,
-                "source_url": source_url,
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
-            }
-            if html_available:
-                raw_payload["html_content"] = html_content
-            else:
-                raw_payload["html_available"] = False
-
-            _write_json_file(out_path, raw_payload)
-            saved_count += 1
-            if saved_count % log_every == 0:
-                logger.info("Fetched SOU documents: %s", saved_count)
-
-            time.sleep(delay_between)
-
-        remaining = _extract_remaining(page_payload)
-        if remaining == 0:
-            break
-        if remaining is None and not documents:
-            break
+            )
 
-        page += 1
+        # existing only grows once a write succeeds, so a later listing entry with the same
+        # output name is fetched only when the earlier one failed.
+        if cfg.max_workers <= 1:
+            for candidate in candidates:
+                if candidate.out_name in existing:
+                    continue
+                result = _fetch_document_content(session, cfg, candidate)
+                if not _store_document(output_dir / candidate.out_name, errors_path, candidate, result):
+                    continue
+                existing.add(candidate.out_name)
+                saved_count += 1
+                if saved_count % cfg.log_every == 0:
+                    logger.info("Fetched SOU documents: %s", saved_count)
+                time.sleep(cfg.delay_between)
+        else:
+            with ThreadPoolExecutor(max_workers=cfg.max_workers) as executor:
+                # Same-name entries are never fetched concurrently: each round takes the first
+                # entry per name, and later ones wait for the next round (dropped if saved).
+                remaining = candidates
+                while remaining:
+                    batch, remaining = _first_candidate_per_name(remaining, existing)
+                    futures = {
+                        executor.submit(fetch_and_pace, candidate): candidate for candidate in batch
+                    }
+                    # Results are written from this thread only, so file and error-log IO stay serial.
+                    for future in as_completed(futures):
+                        candidate = futures[future]
+                        out_path = output_dir / candidate.out_name
+                        if not _store_document(out_path, errors_path, candidate, future.result()):
+                            continue
+                        existing.add(candidate.out_name)
+                        saved_count += 1
+                        if saved_count % cfg.log_every == 0:
+                            logger.info("Fetched SOU documents: %s", saved_count)
 
     return saved_count
 
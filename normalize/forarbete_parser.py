@@ -5,14 +5,33 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+import lxml.html
 import yaml
-from bs4 import BeautifulSoup, Comment, Tag
+from lxml import etree
+from lxml.html import HtmlElement
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger("paragrafenai.noop")
 
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+# Tag given to elements emptied by _clean_tree; no configured tag list can contain it.
+_REMOVED_TAG = "paragrafenai-removed"
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file once per (path, mtime); callers must not mutate the result."""
+    with open(path_str, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YamlLoader)
+
 
 @dataclass
 class ParsedSection:
@@ -46,6 +65,8 @@ class ForarbeteParser:
         self.remove_classes = set(parsing_cfg.get("remove_classes", ["nav", "header", "footer", "breadcrumb", "sidebar"]))
         self.page_tag_names = set(parsing_cfg.get("page_tag_names", ["span"]))
         self.page_class_names = set(parsing_cfg.get("page_class_names", ["page"]))
+        self._remove_classes_lower = {class_name.lower() for class_name in self.remove_classes}
+        self._page_class_names_lower = {class_name.lower() for class_name in self.page_class_names}
 
         page_patterns = parsing_cfg.get(
             "page_number_patterns",
@@ -81,10 +102,13 @@ class ForarbeteParser:
             logger.warning("Hoppar över dokument med tom HTML: %s", raw_doc.get("beteckning", "okänt"))
             return None
 
-        soup = BeautifulSoup(html_text, "lxml")
-        self._clean_soup(soup)
+        root = self._parse_html_tree(html_text)
+        if root is None:
+            logger.error("Kunde inte extrahera avsnitt: %s", raw_doc.get("beteckning", "okänt"))
+            return None
+        self._clean_tree(root)
 
-        sections, strategy = self._extract_sections(soup, html_text)
+        sections, strategy = self._extract_sections(root, html_text)
         if not sections:
             logger.error("Kunde inte extrahera avsnitt: %s", raw_doc.get("beteckning", "okänt"))
             return None
@@ -131,111 +155,170 @@ class ForarbeteParser:
             logger.warning("Config saknas, använder default parserregler: %s", path)
             return {}
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                payload = yaml.safe_load(fh) or {}
-                if isinstance(payload, dict):
-                    return payload
+            payload = _load_yaml_cached(str(path), path.stat().st_mtime_ns) or {}
+            if isinstance(payload, dict):
+                return payload
         except Exception as exc:
             logger.warning("Kunde inte läsa parser-config (%s): %s", path, exc)
         return {}
 
     def _coerce_html_text(self, html_content: Any) -> str:
         if isinstance(html_content, bytes):
-            for encoding in ("utf-8", "windows-1252", "latin-1"):
-                try:
-                    return html_content.decode(encoding)
-                except UnicodeDecodeError:
-                    continue
-            return html_content.decode("utf-8", errors="replace")
+            # utf-8-sig also drops a UTF-8 BOM. A strict decode stops at the first invalid byte,
+            # so only non-UTF-8 documents pay for a second pass.
+            try:
+                return html_content.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                pass
+            try:
+                return html_content.decode("windows-1252")
+            except UnicodeDecodeError:
+                # latin-1 maps every byte, so this cannot fail.
+                return html_content.decode("latin-1")
 
         if isinstance(html_content, str):
             return html_content
 
         return str(html_content)
 
-    def _clean_soup(self, soup: BeautifulSoup) -> None:
-        for tag_name in self.remove_tags:
-            for node in soup.find_all(tag_name):
-                node.decompose()
+    def _parse_html_tree(self, html_text: str) -> HtmlElement | None:
+        try:
+            return lxml.html.document_fromstring(html_text)
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration; the text is
+            # already decoded, so re-parse it as UTF-8 bytes.
+            try:
+                return lxml.html.document_fromstring(
+                    html_text.encode("utf-8"), parser=_UTF8_HTML_PARSER
+                )
+            except etree.ParserError:
+                return None
+        except etree.ParserError:
+            return None
+
+    @staticmethod
+    def _node_text(node: HtmlElement, separator: str = " ") -> str:
+        """Stripped, non-empty text pieces of *node* joined by *separator* (comments excluded)."""
+        return separator.join(text.strip() for text in node.itertext() if text.strip())
 
-        for class_name in self.remove_classes:
-            for node in soup.find_all(class_=self._class_matcher(class_name)):
-                node.decompose()
+    @staticmethod
+    def _normalized_node_text(node: HtmlElement) -> str:
+        """Whitespace-normalized text of *node*; same result as ``_normalize_text(_node_text(node))``.
 
-    def _class_matcher(self, class_name: str):
-        target = class_name.lower()
+        Joining the raw pieces and collapsing once avoids stripping every text node in Python.
+        """
+        return " ".join(" ".join(node.itertext()).split())
+
+    def _clean_tree(self, root: HtmlElement) -> None:
+        # One walk collects every element to drop; removal happens afterwards so the walk is
+        # not disturbed. Emptying in place (instead of drop_tree, which glues the tail onto the
+        # preceding text) keeps the tail as a text node of its own, as after BeautifulSoup's
+        # decompose(), so words on either side stay separated. The emptied element is renamed
+        # so that tag-based walks (page divs, headers, paragraphs) no longer see it.
+        remove_tags = self.remove_tags
+        remove_classes = self._remove_classes_lower
+        doomed: list[HtmlElement] = []
+        for node in root.iter(etree.Element):
+            if node.tag in remove_tags:
+                doomed.append(node)
+                continue
+            classes = node.get("class")
+            if classes and any(value.lower() in remove_classes for value in classes.split()):
+                doomed.append(node)
 
-        def _matcher(classes: Any) -> bool:
-            if classes is None:
-                return False
-            if isinstance(classes, str):
-                values = classes.split()
+        for node in doomed:
+            if node.getparent() is None:
+                node.clear()
             else:
-                values = [str(value) for value in classes]
-            lowered = {value.lower() for value in values}
-            return target in lowered
+                node.clear(keep_tail=True)
+                node.tag = _REMOVED_TAG
 
-        return _matcher
+    def _extract_sections(self, root: HtmlElement, html_text: str) -> tuple[list[ParsedSection], str]:
+        # The header and paragraph strategies share one DOM walk; see _collect_content_events.
+        events = self._collect_content_events(root)
 
-    def _extract_sections(self, soup: BeautifulSoup, html_text: str) -> tuple[list[ParsedSection], str]:
-        sections = self._extract_header_sections(soup)
+        sections = self._extract_header_sections(events)
         if sections:
             return sections, "headers"
 
-        sections = self._extract_page_div_sections(soup)
+        sections = self._extract_page_div_sections(root)
         if sections:
             return sections, "page_divs"
 
-        sections = self._extract_paragraph_sections(soup)
+        sections = self._extract_paragraph_sections(events)
         if sections:
             return sections, "paragraphs"
 
-        sections = self._extract_raw_sections(soup, html_text)
+        sections = self._extract_raw_sections(root, html_text)
         if sections:
             return sections, "raw"
 
         return [], "none"
 
-    def _extract_header_sections(self, soup: BeautifulSoup) -> list[ParsedSection]:
-        sections: list[ParsedSection] = []
-        current: ParsedSection | None = None
-        current_page: int | None = None
+    def _collect_content_events(self, root: HtmlElement) -> list[tuple[str, str, int | None]]:
+        """Walk the DOM once and record headers and paragraphs in document order.
 
-        for node in soup.descendants:
-            if isinstance(node, Comment):
-                current_page = self._extract_page_from_text(str(node)) or current_page
-                continue
-            if not isinstance(node, Tag):
+        Each event is ``(kind, text, page)`` where kind is ``"header"``, ``"paragraph"`` or
+        ``"paragraph_only"`` (a paragraph tag that is also a header tag, which only the
+        paragraph strategy treats as content). Empty texts are not recorded.
+        """
+        events: list[tuple[str, str, int | None]] = []
+        current_page: int | None = None
+        paragraph_tag_list = list(self.paragraph_tags)
+        nested: set[HtmlElement] = set()
+
+        # iter() filters by tag in C, so only comments and configured tags reach Python.
+        relevant_tags = {*self.header_tags, *self.paragraph_tags, *self.page_tag_names}
+        for node in root.iter(etree.Comment, *relevant_tags):
+            if node.tag is etree.Comment:
+                current_page = self._extract_page_from_text(node.text or "") or current_page
                 continue
 
             if self._looks_like_page_tag(node):
                 current_page = self._extract_page_from_tag(node) or current_page
 
-            if node.name in self.header_tags:
-                title = self._normalize_text(node.get_text(" ", strip=True))
-                if not title:
-                    continue
+            is_header = node.tag in self.header_tags
+            if is_header:
+                title = self._normalized_node_text(node)
+                if title:
+                    events.append(("header", title, current_page))
+
+            if node.tag in self.paragraph_tags and node not in nested:
+                # Paragraph tags inside this one are part of its text; registering them here
+                # replaces a per-node ancestor walk. Top-level paragraphs are disjoint, so the
+                # total cost stays linear in the document size. The set also keeps the lxml
+                # proxies alive, so membership checks see the same objects.
+                nested.update(node.iter(*paragraph_tag_list))
+                paragraph = self._normalized_node_text(node)
+                if paragraph:
+                    kind = "paragraph_only" if is_header else "paragraph"
+                    events.append((kind, paragraph, current_page))
+
+        return events
+
+    def _extract_header_sections(
+        self, events: list[tuple[str, str, int | None]]
+    ) -> list[ParsedSection]:
+        sections: list[ParsedSection] = []
+        current: ParsedSection | None = None
+
+        for kind, text, page in events:
+            if kind == "header":
                 if current and current.paragraphs:
                     sections.append(current)
-                current = ParsedSection(title=title, page=current_page)
+                current = ParsedSection(title=text, page=page)
                 continue
 
-            if node.name in self.paragraph_tags and not self._is_nested_content_tag(node):
-                if current is None:
-                    continue
-                paragraph = self._normalize_text(node.get_text(" ", strip=True))
-                if not paragraph:
-                    continue
-                current.paragraphs.append(paragraph)
-                if current.page is None and current_page is not None:
-                    current.page = current_page
+            if kind == "paragraph" and current is not None:
+                current.paragraphs.append(text)
+                if current.page is None and page is not None:
+                    current.page = page
 
         if current and current.paragraphs:
             sections.append(current)
         return sections
 
-
-    def _extract_page_div_sections(self, soup: BeautifulSoup) -> list[ParsedSection]:
+    def _extract_page_div_sections(self, root: HtmlElement) -> list[ParsedSection]:
         """Extract sections from Riksdagen HTML where top-level divs = pages.
 
         Riksdagen's HTML (from data.riksdagen.se) has no semantic headers.
@@ -246,17 +329,17 @@ class ForarbeteParser:
         3. Strips running headers (e.g. "SOU 2026:13")
         4. Returns one ParsedSection per page with page number
         """
-        body = soup.find("body")
-        if not body:
+        body = root.find(".//body")
+        if body is None:
             return []
 
-        top_divs = [c for c in body.children if isinstance(c, Tag) and c.name == "div"]
+        top_divs = [c for c in body if c.tag == "div"]
 
         # Heuristic: need at least 10 page-divs to confirm this is page-based HTML.
         # Fallback: if body has only one wrapper div, look one level deeper.
         if len(top_divs) < 10:
             if len(top_divs) == 1:
-                inner = [c for c in top_divs[0].children if isinstance(c, Tag) and c.name == "div"]
+                inner = [c for c in top_divs[0] if c.tag == "div"]
                 if len(inner) >= 10:
                     top_divs = inner
                 else:
@@ -269,7 +352,7 @@ class ForarbeteParser:
 
         sections: list[ParsedSection] = []
         for i, div in enumerate(top_divs):
-            text = div.get_text(separator="\n")
+            text = "\n".join(div.itertext())
             lines = [l.strip() for l in text.split("\n") if l.strip()]
 
             if not lines:
@@ -301,50 +384,47 @@ class ForarbeteParser:
 
         return sections
 
-    def _extract_paragraph_sections(self, soup: BeautifulSoup) -> list[ParsedSection]:
-        sections: list[ParsedSection] = []
-        current_page: int | None = None
-
-        for node in soup.descendants:
-            if isinstance(node, Comment):
-                current_page = self._extract_page_from_text(str(node)) or current_page
-                continue
-            if not isinstance(node, Tag):
-                continue
-
-            if self._looks_like_page_tag(node):
-                current_page = self._extract_page_from_tag(node) or current_page
-
-            if node.name in self.paragraph_tags and not self._is_nested_content_tag(node):
-                paragraph = self._normalize_text(node.get_text(" ", strip=True))
-                if not paragraph:
-                    continue
-                title = paragraph[:60].rstrip() + "..."
-                sections.append(ParsedSection(title=title, paragraphs=[paragraph], page=current_page))
-
-        return sections
-
-    def _extract_raw_sections(self, soup: BeautifulSoup, html_text: str) -> list[ParsedSection]:
-        text = soup.get_text("\n", strip=True)
-        normalized = re.sub(r"[ \t]+", " ", text)
-        blocks = [self._normalize_text(chunk) for chunk in self.blankline_splitter.split(normalized) if chunk.strip()]
-        if not blocks:
-            return []
+    def _extract_paragraph_sections(
+        self, events: list[tuple[str, str, int | None]]
+    ) -> list[ParsedSection]:
+        return [
+            ParsedSection(title=text[:60].rstrip() + "...", paragraphs=[text], page=page)
+            for kind, text, page in events
+            if kind != "header"
+        ]
 
-        first_page = self._extract_page_from_text(html_text)
+    def _extract_raw_sections(self, root: HtmlElement, html_text: str) -> list[ParsedSection]:
+        text = self._node_text(root, "\n")
         sections: list[ParsedSection] = []
-        for idx, block in enumerate(blocks, start=1):
+        first_page: int | None = None
+        for idx, block in enumerate(self._iter_raw_blocks(text), start=1):
+            if idx == 1:
+                first_page = self._extract_page_from_text(html_text)
             sections.append(ParsedSection(title=f"Avsnitt {idx}", paragraphs=[block], page=first_page))
         return sections
 
-    def _looks_like_page_tag(self, node: Tag) -> bool:
-        if node.name not in self.page_tag_names:
+    def _iter_raw_blocks(self, text: str) -> Iterator[str]:
+        """Yield normalized blank-line separated blocks without materializing a split copy."""
+        start = 0
+        for match in self.blankline_splitter.finditer(text):
+            block = self._normalize_text(text[start : match.start()])
+            if block:
+                yield block
+            start = match.end()
+        block = self._normalize_text(text[start:])
+        if block:
+            yield block
+
+    def _looks_like_page_tag(self, node: HtmlElement) -> bool:
+        if node.tag not in self.page_tag_names:
+            return False
+        class_attr = node.get("class")
+        if not class_attr:
             return False
-        classes = {str(value).lower() for value in (node.get("class") or [])}
-        return any(class_name in classes for class_name in self.page_class_names)
+        return any(value.lower() in self._page_class_names_lower for value in class_attr.split())
 
-    def _extract_page_from_tag(self, node: Tag) -> int | None:
-        text = node.get_text(" ", strip=True)
+    def _extract_page_from_tag(self, node: HtmlElement) -> int | None:
+        text = self._node_text(node)
         return self._extract_page_from_text(text)
 
     def _extract_page_from_text(self, text: str) -> int | None:
@@ -357,14 +437,9 @@ class ForarbeteParser:
                     continue
         return None
 
-    def _is_nested_content_tag(self, node: Tag) -> bool:
-        for parent in node.parents:
-            if isinstance(parent, Tag) and parent.name in self.paragraph_tags:
-                return True
-        return False
-
     def _normalize_text(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text).strip()
+        # str.split() without arguments splits on exactly the characters \s matches.
+        return " ".join(text.split())
 
     def _estimate_tokens(self, text: str) -> int:
         if not text.strip():
@@ -375,15 +450,15 @@ class ForarbeteParser:
         if self._estimate_tokens(paragraph) <= self.max_chunk_tokens:
             return [paragraph]
 
-        sentences = [self._normalize_text(chunk) for chunk in self.sentence_splitter.split(paragraph) if chunk.strip()]
+        # _chunk_section passes whitespace-normalized paragraphs, so stripping the parts is enough.
+        sentences = [part for part in map(str.strip, self.sentence_splitter.split(paragraph)) if part]
         if len(sentences) <= 1:
             return self._split_by_words(paragraph)
 
         parts: list[str] = []
         current: list[str] = []
         current_tokens = 0
-        for sentence in sentences:
-            sentence_tokens = self._estimate_tokens(sentence)
+        for sentence, sentence_tokens in zip(sentences, [self._estimate_tokens(s) for s in sentences]):
             if current and current_tokens + sentence_tokens > self.max_chunk_tokens:
                 parts.append(" ".join(current).strip())
                 current = [sentence]
@@ -408,7 +483,8 @@ class ForarbeteParser:
             parts.append(" ".join(words[idx : idx + words_per_chunk]))
         return parts
 
-    def _chunk_section(self, section: ParsedSection) -> list[dict[str, Any]]:
+    def _chunk_section(self, section: ParsedSection) -> list[str]:
+        """Return the chunk texts of *section*; title and pinpoint are added in _build_chunks."""
         paragraphs: list[str] = []
         for paragraph in section.paragraphs:
             normalized = self._normalize_text(paragraph)
@@ -419,7 +495,12 @@ class ForarbeteParser:
         if not paragraphs:
             return []
 
-        chunks: list[dict[str, Any]] = []
+        # Ordantal räknas en gång per stycke; chunkloopen och minimifiltret räknar sedan med heltal.
+        word_counts = [len(paragraph.split()) for paragraph in paragraphs]
+        tokens = [int(count * 1.3) for count in word_counts]
+
+        chunks: list[str] = []
+        chunk_word_counts: list[int] = []
         idx = 0
         total_paragraphs = len(paragraphs)
 
@@ -430,7 +511,7 @@ class ForarbeteParser:
 
             while cursor < total_paragraphs:
                 candidate = paragraphs[cursor]
-                candidate_tokens = self._estimate_tokens(candidate)
+                candidate_tokens = tokens[cursor]
                 if selected and selected_tokens + candidate_tokens > self.max_chunk_tokens:
                     break
                 selected.append(candidate)
@@ -444,14 +525,8 @@ class ForarbeteParser:
                 selected = [paragraphs[idx]]
                 cursor = idx + 1
 
-            chunks.append(
-                {
-                    "text": "\n\n".join(selected),
-                    "section_title": section.title,
-                    "pinpoint": self._pinpoint(section),
-                    "legal_area": [],
-                }
-            )
+            chunks.append("\n\n".join(selected))
+            chunk_word_counts.append(sum(word_counts[idx:cursor]))
 
             if cursor >= total_paragraphs:
                 break
@@ -462,19 +537,16 @@ class ForarbeteParser:
                 next_idx = cursor
             idx = next_idx if next_idx > idx else cursor
 
-        filtered = [chunk for chunk in chunks if self._estimate_tokens(chunk["text"]) >= self.min_chunk_tokens]
+        filtered = [
+            chunk
+            for chunk, words in zip(chunks, chunk_word_counts)
+            if int(words * 1.3) >= self.min_chunk_tokens
+        ]
         if filtered:
             return filtered
 
         logger.warning("Alla chunks under minimi-gräns i avsnitt '%s', slår ihop till en chunk", section.title)
-        return [
-            {
-                "text": "\n\n".join(paragraphs),
-                "section_title": section.title,
-                "pinpoint": self._pinpoint(section),
-                "legal_area": [],
-            }
-        ]
+        return ["\n\n".join(paragraphs)]
 
     def _pinpoint(self, section: ParsedSection) -> str:
         if section.page is not None:
@@ -483,9 +555,17 @@ class ForarbeteParser:
         return fallback or "Avsnitt"
 
     def _build_chunks(self, sections: list[ParsedSection]) -> list[dict[str, Any]]:
+        # Chunks are plain strings until here, so each output dict is built exactly once.
         chunks: list[dict[str, Any]] = []
         for section in sections:
-            chunks.extend(self._chunk_section(section))
+            texts = self._chunk_section(section)
+            if not texts:
+                continue
+            pinpoint = self._pinpoint(section)
+            chunks.extend(
+                {"text": text, "section_title": section.title, "pinpoint": pinpoint, "legal_area": []}
+                for text in texts
+            )
         return chunks
 
     def _extract_year(self, raw_doc: dict[str, Any]) -> int:
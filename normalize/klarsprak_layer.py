@@ -4,14 +4,34 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger("paragrafenai.noop")
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file once per (path, mtime); callers must not mutate the result."""
+    with open(path_str, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=32)
+def _compile_term_regex(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Build the term alternation once per term set; instances built from one config share it."""
+    alternation = "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b", flags=re.IGNORECASE)
+
+
 class KlarsprakLayer:
     """Apply simple language improvements to legal LLM responses."""
 
@@ -31,7 +51,15 @@ class KlarsprakLayer:
                 if normalized_term and normalized_explanation:
                     self._legal_terms[normalized_term] = normalized_explanation
 
-        self._passive_patterns: list[dict[str, str]] = []
+        # En enda alternation (längsta term först) ersätter en re.sub per term och anrop.
+        self._terms_by_lower: dict[str, tuple[str, str]] = {
+            term.lower(): (term, explanation) for term, explanation in self._legal_terms.items()
+        }
+        self._term_regex: re.Pattern[str] | None = None
+        if self._legal_terms:
+            self._term_regex = _compile_term_regex(tuple(self._legal_terms))
+
+        self._passive_patterns: list[tuple[re.Pattern[str], str]] = []
         raw_patterns = passive_payload.get("passive_patterns", [])
         if isinstance(raw_patterns, list):
             for item in raw_patterns:
@@ -40,16 +68,24 @@ class KlarsprakLayer:
                 pattern = str(item.get("pattern", "")).strip()
                 replacement = str(item.get("replacement", "")).strip()
                 if pattern and replacement:
-                    self._passive_patterns.append({"pattern": pattern, "replacement": replacement})
+                    self._passive_patterns.append(
+                        (re.compile(re.escape(pattern), flags=re.IGNORECASE), replacement)
+                    )
+
+        self._sentence_re = re.compile(r"[^.!?]+[.!?]*")
 
     def process(self, answer: str, query: str, legal_area: str | None = None) -> str:
         """Run all F-10 transformations in the defined order."""
         _ = query
         processed = str(answer)
 
-        processed = self._inject_term_explanations(processed)
-        processed = self._split_long_sentences(processed)
-        processed = self._rewrite_passive_patterns(processed)
+        if self._term_regex is not None:
+            processed = self._inject_term_explanations(processed)
+        # En mening delas bara om den har fler än 40 ord, så kortare svar kan aldrig delas.
+        if len(processed.split()) > 40:
+            processed = self._split_long_sentences(processed)
+        if self._passive_patterns:
+            processed = self._rewrite_passive_patterns(processed)
         processed = self._inject_heading_if_needed(processed, legal_area)
 
         return processed
@@ -62,11 +98,10 @@ class KlarsprakLayer:
 
     def _load_yaml(self, path: Path) -> dict[str, Any]:
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                payload = yaml.safe_load(fh) or {}
-                if isinstance(payload, dict):
-                    return payload
-                return {}
+            payload = _load_yaml_cached(str(path), path.stat().st_mtime_ns) or {}
+            if isinstance(payload, dict):
+                return payload
+            return {}
         except FileNotFoundError:
             logger.warning("Konfigurationsfil saknas: %s", path)
             return {}
@@ -75,46 +110,41 @@ class KlarsprakLayer:
             return {}
 
     def _inject_term_explanations(self, text: str) -> str:
-        updated_text = text
-        for term, explanation in self._legal_terms.items():
-            replacement = f"{term} ({explanation})"
-            updated_text = re.sub(
-                rf"\b{re.escape(term)}\b",
-                replacement,
-                updated_text,
-                count=1,
-                flags=re.IGNORECASE,
-            )
-        return updated_text
-
-    def _split_long_sentences(self, text: str) -> str:
-        current = text
-        for _ in range(3):
-            next_text = self._split_pass_once(current)
-            if next_text == current:
-                break
-            current = next_text
-        return current
-
-    def _split_pass_once(self, text: str) -> str:
-        chunks = re.findall(r"[^.!?]+[.!?]*", text)
-        if not chunks:
+        if self._term_regex is None:
             return text
 
-        processed_chunks: list[str] = []
-        for chunk in chunks:
-            processed_chunks.append(self._split_chunk_if_needed(chunk))
-        return "".join(processed_chunks)
+        seen: set[str] = set()
+
+        def replace_match(match: re.Match[str]) -> str:
+            key = match.group(0).lower()
+            entry = self._terms_by_lower.get(key)
+            if entry is None or key in seen:
+                return match.group(0)
+            seen.add(key)
+            term, explanation = entry
+            return f"{term} ({explanation})"
+
+        return self._term_regex.sub(replace_match, text)
+
+    def _split_long_sentences(self, text: str, max_depth: int = 3) -> str:
+        # Texten tokeniseras en gång; långa meningar delas rekursivt (högst max_depth nivåer).
+        def split_sentence(chunk: str, depth: int) -> str:
+            split = self._split_chunk_if_needed(chunk)
+            if depth <= 1 or split is chunk:
+                return split
+            # Vänsterdelen saknar skiljetecken, så första ". " är den nyss insatta gränsen.
+            head, _, tail = split.partition(". ")
+            return split_sentence(f"{head}.", depth - 1) + split_sentence(f" {tail}", depth - 1)
+
+        matches = list(self._sentence_re.finditer(text))
+        if not matches:
+            return text
+        # Inledande skiljetecken (t.ex. "...") matchas inte av mönstret men ska behållas.
+        prefix = text[: matches[0].start()]
+        return prefix + "".join(split_sentence(match.group(0), max_depth) for match in matches)
 
     def _split_chunk_if_needed(self, chunk: str) -> str:
-        match = re.match(r"^(\s*)(.*?)([.!?]*)$", chunk, flags=re.DOTALL)
-        if not match:
-            return chunk
-
-        leading_ws = match.group(1)
-        body = match.group(2)
-        trailing_punct = match.group(3)
-
+        leading_ws, body, trailing_punct = self._split_affixes(chunk)
         body_stripped = body.strip()
         if len(body_stripped.split()) <= 40:
             return chunk
@@ -131,6 +161,21 @@ class KlarsprakLayer:
 
         return f"{leading_ws}{left}. {right}{trailing_punct}"
 
+    def _split_affixes(self, chunk: str) -> tuple[str, str, str]:
+        """Split a chunk into (leading whitespace, body, trailing .!? run).
+
+        Same result as the former ``^(\\s*)(.*?)([.!?]*)$`` DOTALL match, including a final
+        newline that ``$`` matches before and that therefore belongs to no part.
+        """
+        length = len(chunk)
+        start = length - len(chunk.lstrip())
+        if start == length:
+            return chunk, "", ""
+
+        end = length - 1 if chunk.endswith("\n") else length
+        body_end = start + len(chunk[start:end].rstrip(".!?"))
+        return chunk[:start], chunk[start:body_end], chunk[body_end:end]
+
     def _find_split_point(self, text: str) -> tuple[int, str]:
         for delimiter in [", och ", ", men ", "; "]:
             idx = self._find_outside_parentheses_and_quotes(text, delimiter)
@@ -139,35 +184,36 @@ class KlarsprakLayer:
         return -1, ""
 
     def _find_outside_parentheses_and_quotes(self, text: str, delimiter: str) -> int:
+        # str.find hittar kandidaterna; parentes-/citatstatus räknas bara fram till varje kandidat.
         paren_depth = 0
         in_quotes = False
-        max_start = len(text) - len(delimiter)
-
-        for idx, char in enumerate(text):
-            if char == '"':
-                in_quotes = not in_quotes
-            elif not in_quotes:
-                if char == "(":
-                    paren_depth += 1
-                elif char == ")" and paren_depth > 0:
-                    paren_depth -= 1
-
-            if idx > max_start:
-                continue
-
-            if paren_depth == 0 and not in_quotes and text.startswith(delimiter, idx):
-                return idx
-
-        return -1
+        scanned = 0
+        pos = 0
+
+        while True:
+            candidate = text.find(delimiter, pos)
+            if candidate < 0:
+                return -1
+
+            for char in text[scanned:candidate]:
+                if char == '"':
+                    in_quotes = not in_quotes
+                elif not in_quotes:
+                    if char == "(":
+                        paren_depth += 1
+                    elif char == ")" and paren_depth > 0:
+                        paren_depth -= 1
+            scanned = candidate
+
+            if paren_depth == 0 and not in_quotes:
+                return candidate
+            pos = candidate + 1
 
     def _rewrite_passive_patterns(self, text: str) -> str:
         updated_text = text
-        for item in self._passive_patterns:
-            pattern = item["pattern"]
-            replacement = item["replacement"]
-            regex = re.compile(re.escape(pattern), flags=re.IGNORECASE)
+        for regex, replacement in self._passive_patterns:
 
-            def replace_match(match: re.Match[str]) -> str:
+            def replace_match(match: re.Match[str], replacement: str = replacement) -> str:
                 return self._preserve_capitalization(match.group(0), replacement)
 
             updated_text = regex.sub(replace_match, updated_text)
@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger("paragrafenai.noop")
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file once per (path, mtime); callers must not mutate the result."""
+    with open(path_str, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YamlLoader)
+
+
 class LegalAreaNormalizer:
     """Normalizes legal areas against config/legal_areas.yaml."""
 
@@ -46,7 +59,22 @@ class LegalAreaNormalizer:
         """
         if not raw_areas:
             return raw_areas
+        return self._normalize_values(raw_areas, {})
+
+    def normalize_many(self, batches: Iterable[list[str]]) -> list[list[str]]:
+        """
+        Normalize several legal-area lists (e.g. one per document) in one call.
+
+        Lookups are memoized across the whole batch, so each distinct raw value is
+        resolved, and logged if unknown, only once.
+        """
+        memo: dict[str, str] = {}
+        return [
+            self._normalize_values(raw_areas, memo) if raw_areas else raw_areas
+            for raw_areas in batches
+        ]
 
+    def _normalize_values(self, raw_areas: list[str], memo: dict[str, str]) -> list[str]:
         normalized: list[str] = []
         seen: set[str] = set()
 
@@ -55,9 +83,12 @@ class LegalAreaNormalizer:
             if not value:
                 continue
 
-            canonical = self.alias_to_id.get(value.lower(), value)
-            if canonical not in self.valid_ids:
-                logger.warning("Okänt legal_area-värde, behålls: %s", canonical)
+            canonical = memo.get(value)
+            if canonical is None:
+                canonical = self.alias_to_id.get(value.lower(), value)
+                if canonical not in self.valid_ids:
+                    logger.warning("Okänt legal_area-värde, behålls: %s", canonical)
+                memo[value] = canonical
 
             if canonical not in seen:
                 seen.add(canonical)
@@ -84,10 +115,9 @@ class LegalAreaNormalizer:
             logger.warning("legal_areas-config saknas: %s", path)
             return {}
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                payload = yaml.safe_load(fh) or {}
-                if isinstance(payload, dict):
-                    return payload
+            payload = _load_yaml_cached(str(path), path.stat().st_mtime_ns) or {}
+            if isinstance(payload, dict):
+                return payload
         except Exception as exc:
             logger.error("Kunde inte läsa legal_areas-config (%s): %s", path, exc)
         return {}
@@ -20,10 +20,18 @@ logger = logging.getLogger(__name__)
 MIN_TOKENS = 100
 MAX_TOKENS = 800
 
+_PARA_NUM_RE = re.compile(r"(\d+)")
+_CHUNK_SUFFIX_RE = re.compile(r"_chunk_\d{3}$")
+
 
 def _approx_tokens(text: str) -> int:
     """Enkel tokenuppskattning: ord × 1.3 (svenska ord är långa)."""
-    return int(len(text.split()) * 1.3)
+    return _tokens_for_words(len(text.split()))
+
+
+def _tokens_for_words(word_count: int) -> int:
+    """Tokenuppskattning för ett redan räknat antal ord (samma formel som _approx_tokens)."""
+    return int(word_count * 1.3)
 
 
 def _make_namespace(sfs_nr: str, kapitel: str, paragraf: str, numbering_type: str, chunk_idx: int) -> str:
@@ -41,7 +49,7 @@ def _para_num(paragraf: str) -> int:
     """Extraherar numeriskt värde ur paragraf-sträng för jämförelse.
     '5' -> 5, '5a' -> 5, '3-13' -> 3 (tar första talet), '' -> 0.
     """
-    m = re.match(r"(\d+)", str(paragraf or ""))
+    m = _PARA_NUM_RE.match(str(paragraf or ""))
     return int(m.group(1)) if m else 0
 
 
@@ -64,7 +72,7 @@ def _resolve_namespace_collisions(chunks: list[dict]) -> list[dict]:
         if len(group) <= 1:
             continue
 
-        base = re.sub(r"_chunk_\d{3}$", "", namespace)
+        base = _CHUNK_SUFFIX_RE.sub("", namespace)
         logger.debug("namespace_kollision_löst: %s ×%d", base, len(group))
 
         for chunk_idx, chunk in enumerate(group):
@@ -75,41 +83,71 @@ def _resolve_namespace_collisions(chunks: list[dict]) -> list[dict]:
     return chunks
 
 
+def _split_stycken(stycken: list[str]) -> list[str]:
+    """
+    Grupperar stycken girigt till delar om högst MAX_TOKENS (ett ensamt stycke kan överskrida).
+    Varje stycke räknas en gång; en del slås ihop först när den är färdig.
+    """
+    st_tokens = [_approx_tokens(stycke) for stycke in stycken]
+    sub_chunks = []
+    start = 0
+    acc = 0
+    for k, tokens in enumerate(st_tokens):
+        if acc + tokens > MAX_TOKENS and k > start:
+            sub_chunks.append("\n".join(stycken[start:k]))
+            start = k
+            acc = 0
+        acc += tokens
+    if start < len(stycken):
+        sub_chunks.append("\n".join(stycken[start:]))
+    return sub_chunks
+
+
 def chunk_paragraphs(paragraphs: list[dict], sfs_nr: str, meta: dict) -> list[dict]:
     """
     Tar en lista paragrafobjekt, returnerar en lista färdiga chunks med fullständig metadata.
     """
     chunks = []
     i = 0
+    total = len(paragraphs)
+    # Fälten som loopen läser hämtas en gång per paragraf till parallella listor;
+    # merge-loopen summerar sedan heltal i stället för att dela om text
+    texts = [para["text"].strip() for para in paragraphs]
+    word_counts = [len(text.split()) for text in texts]
+    kapitels = [para.get("kapitel") for para in paragraphs]
+    is_def = [bool(para.get("is_definition")) for para in paragraphs]
+    is_ovg = [bool(para.get("is_overgangsbestammelse")) for para in paragraphs]
+    base = _base_meta(sfs_nr, meta)
     
-    while i < len(paragraphs):
+    while i < total:
         para = paragraphs[i]
-        text = para["text"].strip()
-        tokens = _approx_tokens(text)
+        text = texts[i]
+        tokens = _tokens_for_words(word_counts[i])
         
         # Definitionsparagraf: standalone alltid
-        if para.get("is_definition"):
-            chunk = _make_chunk(sfs_nr, para, text, "", meta, chunk_idx=0, chunk_total=1)
+        if is_def[i]:
+            chunk = _make_chunk(sfs_nr, para, text, "", base, chunk_idx=0, chunk_total=1)
             chunk["chunk_total"] = 1
             chunks.append(chunk)
             i += 1
             continue
         
         # För liten: försök merge med nästa (om samma kapitel)
-        if tokens < MIN_TOKENS and not para.get("is_overgangsbestammelse"):
-            merged_text = text
+        if tokens < MIN_TOKENS and not is_ovg[i]:
+            merged_parts = [text]
+            merged_words = word_counts[i]
             j = i + 1
-            while j < len(paragraphs) and _approx_tokens(merged_text) < MIN_TOKENS:
-                next_para = paragraphs[j]
-                next_text = next_para["text"].strip()
-                would_be = _approx_tokens(merged_text + "\n\n" + next_text)
-                if (next_para["kapitel"] == para["kapitel"]
-                        and not next_para.get("is_definition")
+            while j < total and _tokens_for_words(merged_words) < MIN_TOKENS:
+                would_be = _tokens_for_words(merged_words + word_counts[j])
+                if (kapitels[j] == kapitels[i]
+                        and not is_def[j]
                         and would_be <= MAX_TOKENS):
-                    merged_text += "\n\n" + next_text
+                    merged_parts.append(texts[j])
+                    merged_words += word_counts[j]
                     j += 1
                 else:
                     break
+            merged_text = "\n\n".join(merged_parts)
             
             if j > i + 1:
                 # Kontrollera att slutparagrafen inte är lägre än startparagrafen
@@ -121,16 +159,15 @@ def chunk_paragraphs(paragraphs: list[dict], sfs_nr: str, meta: dict) -> list[di
                         "merge_bakvänd_ordning_skippad: %s -> %s i %s",
                         para["paragraf"], paragraphs[j-1]["paragraf"], sfs_nr,
                     )
-                    chunk = _make_chunk(sfs_nr, para, text, "", meta, chunk_idx=0, chunk_total=1)
+                    chunk = _make_chunk(sfs_nr, para, text, "", base, chunk_idx=0, chunk_total=1)
                     chunks.append(chunk)
                     i += 1
                     continue
 
                 # Merged chunk — använd sista paragrafens nummer som slutnyckel
-                chunk = _make_chunk(sfs_nr, para, merged_text, "", meta, chunk_idx=0, chunk_total=1)
-                chunk["paragraf"] = f"{para['paragraf']}-{paragraphs[j-1]['paragraf']}"
-                chunk["namespace"] = _make_namespace(
-                    sfs_nr, para["kapitel"], chunk["paragraf"], para["numbering_type"], 0
+                chunk = _make_chunk(
+                    sfs_nr, para, merged_text, "", base, chunk_idx=0, chunk_total=1,
+                    paragraf_override=f"{para['paragraf']}-{paragraphs[j-1]['paragraf']}",
                 )
                 chunks.append(chunk)
                 i = j
@@ -138,7 +175,7 @@ def chunk_paragraphs(paragraphs: list[dict], sfs_nr: str, meta: dict) -> list[di
         
         # Lagom stor: 1 chunk = 1 paragraf
         if tokens <= MAX_TOKENS:
-            chunk = _make_chunk(sfs_nr, para, text, "", meta, chunk_idx=0, chunk_total=1)
+            chunk = _make_chunk(sfs_nr, para, text, "", base, chunk_idx=0, chunk_total=1)
             chunks.append(chunk)
             i += 1
             continue
@@ -148,27 +185,17 @@ def chunk_paragraphs(paragraphs: list[dict], sfs_nr: str, meta: dict) -> list[di
         if not stycken:
             stycken = [text]
         
-        current_parts = []
-        current_tokens = 0
-        chunk_idx = 0
-        sub_chunks = []
-        
-        for stycke in stycken:
-            st_tokens = _approx_tokens(stycke)
-            if current_tokens + st_tokens > MAX_TOKENS and current_parts:
-                sub_chunks.append("\n".join(current_parts))
-                current_parts = []
-                current_tokens = 0
-            current_parts.append(stycke)
-            current_tokens += st_tokens
-        
-        if current_parts:
-            sub_chunks.append("\n".join(current_parts))
+        sub_chunks = _split_stycken(stycken)
+        # Alla delchunks delar paragrafens referenser; serialisera dem en gång
+        references_json = json.dumps(para.get("references_to", []), ensure_ascii=False)
         
         chunk_total = len(sub_chunks)
         for idx, sub_text in enumerate(sub_chunks):
             stycke_nr = str(idx + 1) if chunk_total > 1 else ""
-            chunk = _make_chunk(sfs_nr, para, sub_text, stycke_nr, meta, chunk_idx=idx, chunk_total=chunk_total)
+            chunk = _make_chunk(
+                sfs_nr, para, sub_text, stycke_nr, base, chunk_idx=idx, chunk_total=chunk_total,
+                references_json=references_json,
+            )
             chunks.append(chunk)
         
         i += 1
@@ -177,29 +204,27 @@ def chunk_paragraphs(paragraphs: list[dict], sfs_nr: str, meta: dict) -> list[di
     return chunks
 
 
-def _make_chunk(sfs_nr: str, para: dict, text: str, stycke: str, meta: dict, chunk_idx: int, chunk_total: int) -> dict:
-    """Bygger ett fullständigt chunk-objekt med all metadata."""
-    numbering_type = para.get("numbering_type", "sequential")
-    kapitel = para.get("kapitel", "")
-    paragraf = para.get("paragraf", "")
-    
-    ns = _make_namespace(sfs_nr, kapitel, paragraf.replace(" ", ""), numbering_type, chunk_idx)
-    
+def _base_meta(sfs_nr: str, meta: dict) -> dict:
+    """
+    Chunkmall för ett dokument: dokumentfälten sätts här en gång, per-chunk-fälten är
+    platshållare så att nyckelordningen blir densamma som i färdiga chunks.
+    """
     return {
         # Identifiering
-        "namespace": ns,
-        "source_id": meta.get("source_id", str(uuid.uuid4())),
+        "namespace": "",
+        # Saknas source_id delar dokumentets alla chunks ett genererat id
+        "source_id": meta.get("source_id") or str(uuid.uuid4()),
         "source_type": "sfs",
         
         # SFS-specifik metadata
         "sfs_nr": sfs_nr,
         "rubrik": meta.get("rubrik", ""),
         "kortnamn": meta.get("kortnamn", ""),
-        "kapitel": kapitel,
-        "kapitelrubrik": para.get("kapitelrubrik", ""),
-        "paragraf": paragraf,
-        "stycke": stycke,
-        "rubrik_paragraf": para.get("paragraf_rubrik", ""),
+        "kapitel": "",
+        "kapitelrubrik": "",
+        "paragraf": "",
+        "stycke": "",
+        "rubrik_paragraf": "",
         "ikraftträdande": meta.get("ikraftträdande", ""),
         "upphävd": meta.get("upphävd", False),
         "senaste_andring": meta.get("senaste_andring", ""),
@@ -212,25 +237,75 @@ def _make_chunk(sfs_nr: str, para: dict, text: str, stycke: str, meta: dict, chu
         "norm_type": meta.get("norm_type", "lag"),
         "legal_area": meta.get("legal_area", ""),
         "legal_area_confidence": meta.get("legal_area_confidence", "department"),
-        "numbering_type": numbering_type,
+        "numbering_type": "",
         
         # Typade kanter (JSON-sträng för ChromaDB)
-        "references_to": json.dumps(para.get("references_to", []), ensure_ascii=False),
+        "references_to": "",
         
         # Flaggor
-        "is_overgangsbestammelse": para.get("is_overgangsbestammelse", False),
-        "is_definition": para.get("is_definition", False),
-        "has_table": para.get("has_table", False),
+        "is_overgangsbestammelse": False,
+        "is_definition": False,
+        "has_table": False,
         
         # Chunk-metadata
         "embedding_model": "",  # sätts vid indexering
-        "chunk_index": chunk_idx,
-        "chunk_total": chunk_total,
+        "chunk_index": 0,
+        "chunk_total": 0,
         
         # Provenance
         "riksdagen_dok_id": meta.get("riksdagen_dok_id", ""),
         "indexed_at": "",
         
         # Text
-        "text": text.strip(),
+        "text": "",
     }
+
+
+def _make_chunk(
+    sfs_nr: str,
+    para: dict,
+    text: str,
+    stycke: str,
+    base: dict,
+    chunk_idx: int,
+    chunk_total: int,
+    paragraf_override: str | None = None,
+    references_json: str | None = None,
+) -> dict:
+    """
+    Bygger ett fullständigt chunk-objekt utifrån dokumentmallen från _base_meta.
+
+    paragraf_override används för merged chunks ("1-3"); nyckeln går då oförändrad in i namespace.
+    references_json är paragrafens redan serialiserade references_to (delchunks delar den).
+    """
+    numbering_type = para.get("numbering_type", "sequential")
+    kapitel = para.get("kapitel", "")
+    paragraf = para.get("paragraf", "")
+    ns_paragraf = paragraf.replace(" ", "")
+    if paragraf_override is not None:
+        paragraf = ns_paragraf = paragraf_override
+    
+    ns = _make_namespace(sfs_nr, kapitel, ns_paragraf, numbering_type, chunk_idx)
+    
+    chunk = base.copy()
+    chunk.update(
+        namespace=ns,
+        kapitel=kapitel,
+        kapitelrubrik=para.get("kapitelrubrik", ""),
+        paragraf=paragraf,
+        stycke=stycke,
+        rubrik_paragraf=para.get("paragraf_rubrik", ""),
+        numbering_type=numbering_type,
+        references_to=(
+            references_json
+            if references_json is not None
+            else json.dumps(para.get("references_to", []), ensure_ascii=False)
+        ),
+        is_overgangsbestammelse=para.get("is_overgangsbestammelse", False),
+        is_definition=para.get("is_definition", False),
+        has_table=para.get("has_table", False),
+        chunk_index=chunk_idx,
+        chunk_total=chunk_total,
+        text=text.strip(),
+    )
+    return chunk
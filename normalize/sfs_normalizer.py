@@ -11,21 +11,51 @@ Ansvar:
 import re
 import yaml
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
 CONFIG_DIR = Path("config")
 
-# Ladda config-filer
-with open(CONFIG_DIR / "department_area_mapping.yaml") as f:
-    _DEPT_MAP = yaml.safe_load(f)["mappings"]
 
-with open(CONFIG_DIR / "sfs_priority_mapping.yaml") as f:
-    _PRIORITY_MAP = yaml.safe_load(f)["laws"]
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file once per (path, mtime); callers must not mutate the result."""
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path: Path) -> Any:
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
+
+
+# Config-filer laddas vid första användning, inte vid import
+@lru_cache(maxsize=1)
+def _dept_map() -> dict[str, list[str]]:
+    return _load_yaml(CONFIG_DIR / "department_area_mapping.yaml")["mappings"]
+
+
+@lru_cache(maxsize=1)
+def _dept_map_lower() -> tuple[tuple[str, list[str]], ...]:
+    """_dept_map() med gemena nycklar, i samma ordning (första träff vinner)."""
+    return tuple((dept_key.lower(), areas) for dept_key, areas in _dept_map().items())
+
+
+@lru_cache(maxsize=1)
+def _priority_map() -> dict[str, dict]:
+    return _load_yaml(CONFIG_DIR / "sfs_priority_mapping.yaml")["laws"]
+
 
-with open(CONFIG_DIR / "legal_areas.yaml") as f:
-    _LEGAL_AREAS = {a["id"] for a in yaml.safe_load(f)["areas"]}
+@lru_cache(maxsize=1)
+def _legal_areas() -> frozenset[str]:
+    return frozenset(a["id"] for a in _load_yaml(CONFIG_DIR / "legal_areas.yaml")["areas"])
 
 # Grundlagar (hårdkodade SFS-nummer)
 GRUNDLAGAR = {"1974:152", "1974:713", "1949:105", "1991:1469"}
@@ -39,6 +69,15 @@ NORM_TYPE_PATTERNS = [
     (r"(?i)\bbalk\b", "lag"),
     (r"(?i)\blag\b", "lag"),
 ]
+# Alla mönster i en regex; gruppen p<i> motsvarar NORM_TYPE_PATTERNS[i]. Listordningen avgör
+# fortfarande vilken typ som vinner, inte var i rubriken träffen ligger.
+_NORM_TYPE_RE = re.compile(
+    "|".join(
+        f"(?P<p{index}>{pattern.removeprefix('(?i)')})"
+        for index, (pattern, _) in enumerate(NORM_TYPE_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
 
 NAMESPACE_RE = re.compile(r"^sfs::[\d]+:[\w]+_\d+kap_[\w§-]+_chunk_\d{3}$")
 
@@ -47,14 +86,15 @@ REQUIRED_FIELDS = [
     "authority_level", "norm_type", "numbering_type",
     "chunk_index", "chunk_total", "text",
 ]
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
 
 
 def classify_norm_type(sfs_nr: str, rubrik: str) -> str:
     if sfs_nr in GRUNDLAGAR:
         return "grundlag"
-    for pattern, norm_type in NORM_TYPE_PATTERNS:
-        if re.search(pattern, rubrik):
-            return norm_type
+    matched = [int(match.lastgroup[1:]) for match in _NORM_TYPE_RE.finditer(rubrik)]
+    if matched:
+        return NORM_TYPE_PATTERNS[min(matched)][1]
     return "lag"
 
 
@@ -64,17 +104,20 @@ def classify_legal_area(sfs_nr: str, departement: str) -> tuple[str, str]:
     Lager 2 > Lager 1.
     """
     # Lager 2: manuell YAML
-    if sfs_nr in _PRIORITY_MAP:
-        entry = _PRIORITY_MAP[sfs_nr]
+    priority_map = _priority_map()
+    legal_areas = _legal_areas()
+    if sfs_nr in priority_map:
+        entry = priority_map[sfs_nr]
         areas = entry.get("legal_area", [])
-        valid = [a for a in areas if a in _LEGAL_AREAS]
+        valid = [a for a in areas if a in legal_areas]
         if valid:
             return ",".join(valid), "manual"
     
     # Lager 1: departement
-    for dept_key, areas in _DEPT_MAP.items():
-        if dept_key.lower() in departement.lower():
-            valid = [a for a in areas if a in _LEGAL_AREAS]
+    departement_lower = departement.lower()
+    for dept_key_lower, areas in _dept_map_lower():
+        if dept_key_lower in departement_lower:
+            valid = [a for a in areas if a in legal_areas]
             if valid:
                 return ",".join(valid), "department"
     
@@ -83,15 +126,17 @@ def classify_legal_area(sfs_nr: str, departement: str) -> tuple[str, str]:
 
 
 def get_kortnamn(sfs_nr: str) -> str:
-    if sfs_nr in _PRIORITY_MAP:
-        return _PRIORITY_MAP[sfs_nr].get("kortnamn", "")
+    priority_map = _priority_map()
+    if sfs_nr in priority_map:
+        return priority_map[sfs_nr].get("kortnamn", "")
     return ""
 
 
 def get_verified_numbering_type(sfs_nr: str, detected: str) -> str:
     """Returnerar YAML-override om numbering_type_verified=True, annars detected."""
-    if sfs_nr in _PRIORITY_MAP:
-        entry = _PRIORITY_MAP[sfs_nr]
+    priority_map = _priority_map()
+    if sfs_nr in priority_map:
+        entry = priority_map[sfs_nr]
         if entry.get("numbering_type_verified") and "numbering_type" in entry:
             yaml_type = entry["numbering_type"]
             if yaml_type != detected and sfs_nr not in _warned_sfs_type:
@@ -150,18 +195,19 @@ def validate_chunk(chunk: dict) -> list[str]:
     """Returnerar lista med valideringsfel (tom = OK)."""
     errors = []
     
-    # Obligatoriska fält
-    for field in REQUIRED_FIELDS:
-        if field not in chunk or chunk[field] is None:
-            errors.append(f"Saknar obligatoriskt fält: {field} i {chunk.get('namespace', '?')}")
+    # Obligatoriska fält — vanliga fallet (alla finns) avgörs med en set-operation,
+    # felmeddelanden byggs i REQUIRED_FIELDS-ordning bara när något saknas
+    if not _REQUIRED_FIELD_SET.issubset(chunk.keys()) or any(chunk[f] is None for f in REQUIRED_FIELDS):
+        for field in REQUIRED_FIELDS:
+            if field not in chunk or chunk[field] is None:
+                errors.append(f"Saknar obligatoriskt fält: {field} i {chunk.get('namespace', '?')}")
     
     # Namespace-format
     ns = chunk.get("namespace", "")
+    # NAMESPACE_RE tillåter redan merged paragrafer (t.ex. 1-3§); det tidigare "relaxade"
+    # mönstret (sfs::ÅÅÅÅ:nr_...) var en delmängd av det och kunde aldrig släppa igenom mer
     if not NAMESPACE_RE.match(ns):
-        # Tillåt merged paragrafer (t.ex. 1-3§) — relaxa regex
-        relaxed = re.match(r"^sfs::\d{4}:\d+_\d+kap_[\w§\-]+_chunk_\d{3}$", ns)
-        if not relaxed:
-            errors.append(f"Ogiltigt namespace-format: {ns}")
+        errors.append(f"Ogiltigt namespace-format: {ns}")
     
     # Text ej tom
     if not chunk.get("text", "").strip():
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import bisect
 import html as html_lib
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import lxml.html as lxml_html
+    from lxml import etree
+except ImportError:  # pragma: no cover - BeautifulSoup/regex fallbacks are used instead
+    lxml_html = None  # type: ignore[assignment]
+    etree = None  # type: ignore[assignment]
 
 try:
     from bs4 import BeautifulSoup
@@ -25,19 +33,46 @@ class _Heading:
 class SfsParser:
     """Parser that chunks SFS documents with paragraph-first strategy."""
 
-    KAPITEL_PATTERNS = [
-        re.compile(r"^(\d+)\s*[Kk]ap\.?\s*(.*)$"),
-        re.compile(r"^[Kk]apitel\s+(\d+)\.?\s*(.*)$"),
-        re.compile(r"^[Kk][Aa][Pp]\.?\s*(\d+)\.?\s*(.*)$"),
-    ]
-
+    # Kapitel- och specialrubriker hittas med en enda finditer över texten i stället för
+    # två regexanrop per rad. Alternativen prövas i samma ordning som tidigare (kapitel-
+    # mönstren före specialrubrikerna) och får inte gå över radbrytningar, därav [^\S\n].
+    # Matchen börjar på radens början (inledande mellanrum ingår), som den tidigare offseten.
+    _HEADING_RE = re.compile(
+        r"(?m)^[^\S\n]*(?:"
+        r"(?P<kap_a>\d+)[^\S\n]*[Kk]ap\.?[^\S\n]*(?P<titel_a>.*)"
+        r"|[Kk]apitel[^\S\n]+(?P<kap_b>\d+)\.?[^\S\n]*(?P<titel_b>.*)"
+        r"|[Kk][Aa][Pp]\.?[^\S\n]*(?P<kap_c>\d+)\.?[^\S\n]*(?P<titel_c>.*)"
+        r"|(?i:(?P<special>Övergångsbestämmelser|Bilag(?:a|or)|Ikraftträdande(?:bestämmelser)?)\b.*)"
+        r")$"
+    )
+    # Övriga radbrytningar enligt str.splitlines(); de byts mot \n (ett tecken mot ett, så
+    # offseten består) innan _HEADING_RE körs. De är ovanliga, så ersättningen görs bara när
+    # något av tecknen finns (en snabb delsträngssökning per tecken).
+    _OTHER_LINE_BREAKS = "\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+    _OTHER_LINE_BREAKS_RE = re.compile(f"[{_OTHER_LINE_BREAKS}]")
     _PARAGRAF_START_RE = re.compile(
         r"(?m)^\s*(?:(?P<num_a>\d+[A-Za-z]?)\s*§|§\s*(?P<num_b>\d+[A-Za-z]?))(?=\s|$)"
     )
     _NUMBERED_START_RE = re.compile(r"(?m)^\s*(?P<num>\d+[A-Za-z]?)\.\s+")
-    _SPECIAL_HEADING_RE = re.compile(
-        r"(?i)^(?P<heading>Övergångsbestämmelser|Bilag(?:a|or)|Ikraftträdande(?:bestämmelser)?)\b.*$"
+    # Element som rensas bort före textutvinning (samma urval som CSS-selektorerna i BS4-vägen).
+    _REMOVE_TAGS = frozenset({"script", "style", "noscript", "nav", "header", "footer", "aside"})
+    _REMOVE_CLASSES = frozenset({"breadcrumb", "breadcrumbs", "pagination", "cookie", "cookies"})
+    _REMOVE_IDS = frozenset({"menu", "nav"})
+    _BS4_REMOVE_SELECTOR = ", ".join(
+        [*sorted(_REMOVE_TAGS), *(f".{name}" for name in sorted(_REMOVE_CLASSES))]
+        + [f"#{name}" for name in sorted(_REMOVE_IDS)]
+    )
+
+    # Unrolled loop instead of two lazy .*? so unterminated blocks are scanned in linear time.
+    _NON_CONTENT_BLOCK_RE = re.compile(
+        r"(?is)<(script|style|noscript)\b[^>]*>[^<]*(?:<(?!/\1>)[^<]*)*</\1>"
     )
+    _BR_RE = re.compile(r"(?i)<br\s*/?>")
+    _BLOCK_END_RE = re.compile(r"(?i)</(p|div|li|h1|h2|h3|h4|h5|h6|tr|section|article)>")
+    _TAG_RE = re.compile(r"(?s)<[^>]+>")
+    _EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+    _EXCESS_SPACES_RE = re.compile(r"[ \t]{2,}")
+    _BLANK_LINE_SPLIT_RE = re.compile(r"\n{2,}")
 
     def __init__(self, max_fallback_tokens: int = 1200) -> None:
         self.max_fallback_tokens = max_fallback_tokens
@@ -81,8 +116,22 @@ class SfsParser:
             "chunks": chunks,
         }
 
+    def parse_many(self, raw_docs: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any] | None]:
+        """Parse a batch of raw SFS documents lazily, one result (or None) per input document.
+
+        All patterns are compiled at class level and lxml reuses its default parser, so one
+        SfsParser can serve a whole batch; nothing is rebuilt per document.
+        """
+        for raw_doc in raw_docs:
+            yield self.parse(raw_doc)
+
     def _clean_html_to_text(self, html_content: str) -> str:
         """Remove non-content HTML and return readable text."""
+        if lxml_html is not None:
+            text = self._clean_html_lxml(html_content)
+            if text is not None:
+                return text
+
         if BeautifulSoup is None:
             return self._clean_html_fallback(html_content)
 
@@ -91,72 +140,83 @@ class SfsParser:
         except Exception:
             soup = BeautifulSoup(html_content, "html.parser")
 
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-
-        for selector in (
-            "nav",
-            "header",
-            "footer",
-            "aside",
-            ".breadcrumb",
-            ".breadcrumbs",
-            ".pagination",
-            ".cookie",
-            ".cookies",
-            "#menu",
-            "#nav",
-        ):
-            for el in soup.select(selector):
+        # En enda select-vandring i stället för en per selektor; element inuti ett redan
+        # borttaget element är då också träffar och hoppas över.
+        for el in soup.select(self._BS4_REMOVE_SELECTOR):
+            if not el.decomposed:
                 el.decompose()
 
         return soup.get_text(separator="\n")
 
+    def _clean_html_lxml(self, html_content: str) -> str | None:
+        """Single lxml pass: drop non-content elements, then join all text nodes by newline.
+
+        Returns None when lxml cannot parse the document, so the BeautifulSoup path runs instead.
+        """
+        try:
+            root = lxml_html.document_fromstring(html_content)
+        except (ValueError, etree.ParserError):
+            return None
+
+        doomed = []
+        for el in root.iter(etree.Element):
+            if el.tag in self._REMOVE_TAGS:
+                doomed.append(el)
+                continue
+            classes = el.get("class")
+            if classes and not self._REMOVE_CLASSES.isdisjoint(classes.split()):
+                doomed.append(el)
+            elif el.get("id") in self._REMOVE_IDS:
+                doomed.append(el)
+
+        for el in doomed:
+            # Emptying in place (instead of drop_tree) keeps the tail as a text node of its
+            # own, as after BeautifulSoup's decompose(), so the newline joins stay the same.
+            el.clear(keep_tail=True)
+
+        return "\n".join(root.itertext())
+
     def _clean_html_fallback(self, html_content: str) -> str:
-        cleaned = re.sub(r"(?is)<(script|style|noscript)\b.*?>.*?</\1>", " ", html_content)
-        cleaned = re.sub(r"(?i)<br\s*/?>", "\n", cleaned)
-        cleaned = re.sub(r"(?i)</(p|div|li|h1|h2|h3|h4|h5|h6|tr|section|article)>", "\n", cleaned)
-        cleaned = re.sub(r"(?s)<[^>]+>", " ", cleaned)
+        cleaned = self._NON_CONTENT_BLOCK_RE.sub(" ", html_content)
+        cleaned = self._BR_RE.sub("\n", cleaned)
+        cleaned = self._BLOCK_END_RE.sub("\n", cleaned)
+        cleaned = self._TAG_RE.sub(" ", cleaned)
         return html_lib.unescape(cleaned)
 
     def _normalize_text(self, text: str) -> str:
+        # Only \r\n, \r and \n are line breaks; splitlines() would also split on \x0c, \x85,
+        # \u2028 etc. and move paragraph boundaries.
         text = text.replace("\r\n", "\n").replace("\r", "\n")
-        lines = [line.strip() for line in text.split("\n")]
-        text = "\n".join(lines)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r"[ \t]{2,}", " ", text)
+        text = "\n".join(line.strip() for line in text.split("\n"))
+        text = self._EXCESS_NEWLINES_RE.sub("\n\n", text)
+        text = self._EXCESS_SPACES_RE.sub(" ", text)
         return text.strip()
 
     def _extract_headings(self, text: str) -> list[_Heading]:
+        """Collect chapter and special headings in offset order.
+
+        Lines are split as by str.splitlines(); offsets are the line starts in *text*.
+        """
+        if any(char in text for char in self._OTHER_LINE_BREAKS):
+            text = self._OTHER_LINE_BREAKS_RE.sub("\n", text)
         headings: list[_Heading] = []
-        offset = 0
-        for line in text.splitlines(keepends=True):
-            stripped = line.strip()
-            if stripped:
-                chapter_heading = self._parse_chapter_line(stripped)
-                if chapter_heading is not None:
-                    headings.append(_Heading(offset, chapter_heading[0], chapter_heading[1]))
-                else:
-                    special_heading = self._parse_special_heading(stripped)
-                    if special_heading is not None:
-                        headings.append(_Heading(offset, None, special_heading))
-            offset += len(line)
+        for match in self._HEADING_RE.finditer(text):
+            special = match.group("special")
+            if special is not None:
+                headings.append(_Heading(match.start(), None, self._special_heading_name(special)))
+                continue
+            if match.group("kap_a") is not None:
+                kapitel_nr, kapitel_titel = match.group("kap_a", "titel_a")
+            elif match.group("kap_b") is not None:
+                kapitel_nr, kapitel_titel = match.group("kap_b", "titel_b")
+            else:
+                kapitel_nr, kapitel_titel = match.group("kap_c", "titel_c")
+            headings.append(
+                _Heading(match.start(), kapitel_nr, self._as_optional_str(kapitel_titel))
+            )
         return headings
 
-    def _parse_chapter_line(self, line: str) -> tuple[str, str | None] | None:
-        for pattern in self.KAPITEL_PATTERNS:
-            match = pattern.match(line)
-            if match:
-                kapitel_nr = match.group(1).strip()
-                kapitel_titel = self._as_optional_str(match.group(2))
-                return kapitel_nr, kapitel_titel
-        return None
-
-    def _parse_special_heading(self, line: str) -> str | None:
-        match = self._SPECIAL_HEADING_RE.match(line)
-        if not match:
-            return None
-        heading = match.group("heading")
+    def _special_heading_name(self, heading: str) -> str:
         lowered = heading.lower()
         if lowered.startswith("övergång"):
             return "Övergångsbestämmelser"
@@ -171,16 +231,17 @@ class SfsParser:
         if not matches:
             return []
 
+        heading_starts = [heading.start for heading in headings]
+        starts = [match.start() for match in matches]
+        ends = starts[1:] + [len(text)]
         chunks: list[dict[str, Any]] = []
-        for index, match in enumerate(matches):
-            start = match.start()
-            end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        for match, start, end in zip(matches, starts, ends):
             chunk_text = text[start:end].strip()
             if not chunk_text:
                 continue
 
             paragraf_nr = (match.group("num_a") or match.group("num_b") or "").strip().lower() or None
-            kapitel_nr, kapitel_titel = self._heading_for_position(start, headings)
+            kapitel_nr, kapitel_titel = self._heading_for_position(start, headings, heading_starts)
             chunks.append(
                 {
                     "paragraf_nr": paragraf_nr,
@@ -197,10 +258,10 @@ class SfsParser:
         if not matches:
             return []
 
+        starts = [match.start() for match in matches]
+        ends = starts[1:] + [len(text)]
         chunks: list[dict[str, Any]] = []
-        for index, match in enumerate(matches):
-            start = match.start()
-            end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        for match, start, end in zip(matches, starts, ends):
             chunk_text = text[start:end].strip()
             if not chunk_text:
                 continue
@@ -217,7 +278,7 @@ class SfsParser:
         return chunks
 
     def _parse_paragraph_fallback(self, text: str) -> list[dict[str, Any]]:
-        blocks = [block.strip() for block in re.split(r"\n{2,}", text) if block.strip()]
+        blocks = [block.strip() for block in self._BLANK_LINE_SPLIT_RE.split(text) if block.strip()]
         if not blocks:
             return []
 
@@ -261,20 +322,19 @@ class SfsParser:
         return chunks
 
     def _heading_for_position(
-        self, position: int, headings: list[_Heading]
+        self, position: int, headings: list[_Heading], heading_starts: list[int]
     ) -> tuple[str | None, str | None]:
-        chosen: _Heading | None = None
-        for heading in headings:
-            if heading.start > position:
-                break
-            chosen = heading
-        if chosen is None:
+        # headings are in offset order; heading_starts mirrors them for binary search.
+        idx = bisect.bisect_right(heading_starts, position) - 1
+        if idx < 0:
             return None, None
+        chosen = headings[idx]
         return chosen.kapitel_nr, chosen.kapitel_titel
 
     def _token_estimate(self, text: str) -> int:
         # Light-weight approximation that keeps fallback chunks reasonably bounded.
-        return len(re.findall(r"\S+", text))
+        # str.split() counts the same \S+ runs as a regex would, but stays in C.
+        return len(text.split())
 
     def _as_optional_str(self, value: Any) -> str | None:
         if value is None:
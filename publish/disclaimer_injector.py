@@ -9,11 +9,14 @@ class DisclaimerInjector:
 
     _logger = logging.getLogger("paragrafenai.noop")
     _separator = "\n\n---\n"
-    _disclaimer_template = (
+    # Fixed text around the date and the source list; inject() only concatenates.
+    _disclaimer_prefix = (
         "⚠️ *Detta är juridisk information, inte juridisk rådgivning. "
-        "Kontrollera alltid mot primärkällan. Uppdaterad per {date}.*"
+        "Kontrollera alltid mot primärkällan. Uppdaterad per "
     )
-    _sources_template = "*Källor: {sources}*"
+    _disclaimer_suffix = ".*"
+    _sources_prefix = "\n*Källor: "
+    _sources_suffix = "*"
 
     def inject(
         self,
@@ -33,14 +36,11 @@ class DisclaimerInjector:
             response_text + disclaimer-fotnot.
         """
         effective_date = date or datetime.date.today().isoformat()
-        disclaimer_lines = [self._disclaimer_template.format(date=effective_date)]
+        disclaimer_body = self._disclaimer_prefix + effective_date + self._disclaimer_suffix
 
         if sources:
-            disclaimer_lines.append(
-                self._sources_template.format(sources=" · ".join(sources))
-            )
+            disclaimer_body += self._sources_prefix + " · ".join(sources) + self._sources_suffix
 
-        disclaimer_body = "\n".join(disclaimer_lines)
         disclaimer_block = f"---\n{disclaimer_body}"
 
         if not response_text:
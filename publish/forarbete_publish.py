@@ -10,11 +10,14 @@ import random
 import re
 import sys
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
 from datetime import date
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 try:
     import yaml  # type: ignore
@@ -26,6 +29,11 @@ try:
 except Exception:  # pragma: no cover - exercised only when jsonschema is missing
     jsonschema = None
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - exercised only when orjson is missing
+    orjson = None
+
 
 logger = getLogger("paragrafenai.noop")
 
@@ -45,6 +53,15 @@ FILENAME_SOU_RE = re.compile(
 SOU_RE = re.compile(
     r"(?i)\b(?:SOU[\s_-]*)?(\d{4})[\s:_-]*(\d+)([a-zA-Z]?)(?:\s+(.*))?$"
 )
+# Values already in the form canonicalize_sou_number produces: no leading zeros in the
+# sequence number, and a tail of single-space separated words without ':', '_' or '-'.
+SOU_CANONICAL_RE = re.compile(r"SOU [0-9]{4}:(?:0|[1-9][0-9]*)[a-zA-Z]?(?: [^\s:_-]+)*")
+# norm_sha256 in the head of a file written by process_document (indent=2, front_matter
+# first). Only four-space lines are crossed, so the match stays inside front_matter.
+PUBLISHED_NORM_SHA_RE = re.compile(
+    rb'\A\{\n  "front_matter": \{\n(?:    [^\n]*\n)*?    "norm_sha256": "([0-9a-f]{64})"'
+)
+_IDEMPOTENCY_HEAD_BYTES = 4096
 
 
 class PublishError(Exception):
@@ -85,28 +102,30 @@ class Config:
     log_level: str = "noop"
 
 
+# One line of the simple config format, with any "# ..." comment: either a top-level
+# "section:" line or an indented "key: value" line. Other lines do not match.
+_SIMPLE_YAML_LINE_RE = re.compile(
+    r"(?m)^(?:(?P<section>(?! )[^\n#]*?):"
+    r"| (?P<key>[^\n#:]*):(?P<value>[^\n#]*))"
+    r"[^\S\n]*(?:#[^\n]*)?$"
+)
+
+
 def _parse_simple_yaml(text: str) -> dict[str, Any]:
     """Minimal YAML parser for simple nested key-value config files."""
     data: dict[str, Any] = {}
     current_section: str | None = None
-    for raw_line in text.splitlines():
-        line = raw_line.split("#", 1)[0].rstrip()
-        if not line.strip():
-            continue
-        if not line.startswith(" "):
-            if not line.endswith(":"):
-                continue
-            current_section = line[:-1].strip()
+    # splitlines() decides what a line break is; the regex then scans all lines in one pass.
+    for match in _SIMPLE_YAML_LINE_RE.finditer("\n".join(text.splitlines())):
+        section = match.group("section")
+        if section is not None:
+            current_section = section.strip()
             data[current_section] = {}
             continue
         if current_section is None:
             continue
-        stripped = line.strip()
-        if ":" not in stripped:
-            continue
-        key, value = stripped.split(":", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
+        key = match.group("key").strip()
+        value = match.group("value").strip().strip('"').strip("'")
         if value.isdigit():
             parsed: Any = int(value)
         elif value.lower() in {"true", "false"}:
@@ -144,11 +163,10 @@ def _resolve_path(path_str: str, base_dir: Path) -> Path:
     return (base_dir / path).resolve()
 
 
-def load_config(config_path_arg: str | None = None) -> tuple[Config, Path]:
-    raw_path = config_path_arg or os.environ.get("PARAGRAFEN_CONFIG", DEFAULT_CONFIG_PATH)
-    config_path = Path(raw_path).resolve()
-    ensure_default_config(config_path)
-
+@lru_cache(maxsize=4)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Config:
+    """Parse, merge and resolve a config file once per (path, mtime)."""
+    config_path = Path(path_str)
     text = config_path.read_text(encoding="utf-8")
     if yaml is not None:
         loaded = yaml.safe_load(text) or {}
@@ -160,7 +178,7 @@ def load_config(config_path_arg: str | None = None) -> tuple[Config, Path]:
     merged.update(section)
 
     config_dir = config_path.parent
-    cfg = Config(
+    return Config(
         norm_dir=_resolve_path(str(merged["norm_dir"]), config_dir.parent),
         published_dir=_resolve_path(str(merged["published_dir"]), config_dir.parent),
         schema_path=_resolve_path(str(merged["schema_path"]), config_dir.parent),
@@ -168,13 +186,24 @@ def load_config(config_path_arg: str | None = None) -> tuple[Config, Path]:
         idempotency_strategy=str(merged.get("idempotency_strategy", "sha256")),
         log_level=str(merged.get("log_level", "noop")),
     )
-    return cfg, config_path
+
+
+def load_config(config_path_arg: str | None = None) -> tuple[Config, Path]:
+    raw_path = config_path_arg or os.environ.get("PARAGRAFEN_CONFIG", DEFAULT_CONFIG_PATH)
+    config_path = Path(raw_path).resolve()
+    ensure_default_config(config_path)
+
+    cached = _load_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+    # Config is mutable; hand out a copy so callers cannot alter the cached instance.
+    return replace(cached), config_path
 
 
 def canonicalize_sou_number(value: str) -> str:
     raw = (value or "").strip()
     if not raw:
         raise ExtractionError("Empty SOU number")
+    if SOU_CANONICAL_RE.fullmatch(raw):
+        return raw
 
     cleaned = raw.replace("_", " ").replace(":", " ").replace("-", " ")
     cleaned = re.sub(r"\s+", " ", cleaned).strip()
@@ -243,8 +272,24 @@ def generate_source_id(sou_number: str) -> str:
 
 
 def sha256_of_norm(doc: dict[str, Any]) -> str:
-    canonical = json.dumps(doc, sort_keys=True, ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    # The digest is the idempotency key stored in already published files, so the input must
+    # stay byte-identical to json.dumps(doc, sort_keys=True, ensure_ascii=False). Top-level
+    # values are encoded one at a time with the C encoder (iterencode without _one_shot falls
+    # back to the pure-Python one), so only one value's string is alive at a time.
+    if not isinstance(doc, dict) or not all(isinstance(key, str) for key in doc):
+        return hashlib.sha256(
+            json.dumps(doc, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    digest = hashlib.sha256(b"{")
+    for index, key in enumerate(sorted(doc)):
+        if index:
+            digest.update(b", ")
+        digest.update(json.dumps(key, ensure_ascii=False).encode("utf-8"))
+        digest.update(b": ")
+        digest.update(json.dumps(doc[key], sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    digest.update(b"}")
+    return digest.hexdigest()
 
 
 def build_front_matter(doc: dict[str, Any], filename: str, published_at: str | None = None) -> dict[str, Any]:
@@ -297,18 +342,90 @@ def _validate_front_matter_fallback(front_matter: dict[str, Any], schema: dict[s
             raise ValidationError(f"Field {key!r} has invalid value {value!r}")
 
 
+# Checked jsonschema validators keyed by id() of the schema dict; the dict is kept alongside
+# so the id cannot be reused by another object while the entry exists.
+_SCHEMA_VALIDATORS: dict[int, tuple[dict[str, Any], Any]] = {}
+
+
+def _schema_validator(schema: dict[str, Any]) -> Any:
+    cached = _SCHEMA_VALIDATORS.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    if len(_SCHEMA_VALIDATORS) >= 8:
+        _SCHEMA_VALIDATORS.clear()
+    _SCHEMA_VALIDATORS[id(schema)] = (schema, validator)
+    return validator
+
+
 def validate_front_matter(front_matter: dict[str, Any], schema: dict[str, Any]) -> None:
     try:
         if jsonschema is not None:
-            jsonschema.validate(instance=front_matter, schema=schema)
+            # Same error selection as jsonschema.validate(), without re-checking the schema
+            # and building a new validator for every document.
+            error = jsonschema.exceptions.best_match(
+                _schema_validator(schema).iter_errors(front_matter)
+            )
+            if error is not None:
+                raise error
         else:
             _validate_front_matter_fallback(front_matter, schema)
     except Exception as exc:
         raise ValidationError(str(exc)) from exc
 
 
+@lru_cache(maxsize=8)
+def _load_schema_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    with open(path_str, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
 def load_schema(schema_path: Path) -> dict[str, Any]:
-    return json.loads(schema_path.read_text(encoding="utf-8"))
+    """Parse the schema once per (path, mtime); callers must not mutate the result."""
+    return _load_schema_cached(str(schema_path), schema_path.stat().st_mtime_ns)
+
+
+def _iter_json_files(root: Path) -> Iterator[str]:
+    """Yield the paths of all *.json files below root, as strings.
+
+    Walks with os.scandir, whose entries carry their file type, instead of rglob("*.json"),
+    which builds a Path per entry. Symlinked directories are not descended into (as with
+    rglob); directories that happen to be named *.json are skipped.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path
+
+
+def _path_sort_key(path: str) -> list[str]:
+    # Same order as sorting Path objects, which compare component by component.
+    return os.path.normcase(path).split(os.sep)
+
+
+def _reservoir_sample(items: Iterable[str], size: int) -> list[str]:
+    """Uniform sample of at most ``size`` items in one pass (Algorithm R), holding only the sample."""
+    reservoir: list[str] = []
+    if size <= 0:
+        return reservoir
+    for seen, item in enumerate(items):
+        if seen < size:
+            reservoir.append(item)
+        else:
+            slot = random.randrange(seen + 1)
+            if slot < size:
+                reservoir[slot] = item
+    return reservoir
 
 
 def _chunked(items: list[Path], size: int) -> list[list[Path]]:
@@ -316,13 +433,73 @@ def _chunked(items: list[Path], size: int) -> list[list[Path]]:
 
 
 def _load_json_file(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _load_json_file_with_parser(path)[0]
+
+
+def _load_json_file_with_parser(path: Path) -> tuple[dict[str, Any], bool]:
+    """Load a JSON file; the flag is True when the stdlib had to parse it.
+
+    orjson rejects NaN/Infinity, so only stdlib-parsed documents can hold non-finite floats.
+    """
+    if orjson is None:
+        return json.loads(path.read_text(encoding="utf-8")), True
+    raw = path.read_bytes()
+    try:
+        return orjson.loads(raw), False
+    except orjson.JSONDecodeError:
+        # orjson is stricter (NaN, integers beyond 64 bits); let the stdlib decide.
+        return json.loads(raw.decode("utf-8")), True
+
+
+def _dump_published(output: dict[str, Any], stdlib_only: bool = False) -> bytes:
+    """Serialize a published document as UTF-8 JSON with two-space indentation.
+
+    Pass stdlib_only for documents the stdlib had to parse: orjson would write their
+    NaN/Infinity as null instead of raising.
+    """
+    if orjson is not None and not stdlib_only:
+        try:
+            return orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(output, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_atomic(target_path: Path, payload: bytes) -> None:
+    """Write via a sibling temp file and os.replace, so a crash never leaves a half-written file."""
+    tmp_path = target_path.with_name(f"{target_path.name}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_published_norm_sha(target_path: Path) -> str | None:
+    """Read norm_sha256 from the head of a published file without parsing the document.
+
+    Returns None when the head does not have the expected layout or the file does not end
+    like a complete two-space indented JSON object (e.g. an interrupted write).
+    """
+    with target_path.open("rb") as fh:
+        head = fh.read(_IDEMPOTENCY_HEAD_BYTES)
+        match = PUBLISHED_NORM_SHA_RE.match(head)
+        if match is None:
+            return None
+        fh.seek(-2, os.SEEK_END)
+        if fh.read(2) != b"\n}":
+            return None
+    return match.group(1).decode("ascii")
 
 
 def _should_skip_by_idempotency(target_path: Path, norm_sha: str) -> bool:
     if not target_path.exists():
         return False
     try:
+        existing_sha = _read_published_norm_sha(target_path)
+        if existing_sha is not None:
+            return existing_sha == norm_sha
         existing = _load_json_file(target_path)
         existing_sha = (
             existing.get("front_matter", {}).get("norm_sha256")
@@ -341,7 +518,7 @@ def process_document(
     dry_run: bool = False,
     force: bool = False,
 ) -> str:
-    doc = _load_json_file(source_path)
+    doc, parsed_by_stdlib = _load_json_file_with_parser(source_path)
     front_matter = build_front_matter(doc, source_path.name)
     validate_front_matter(front_matter, schema)
     output = {"front_matter": front_matter, "document": doc}
@@ -356,19 +533,47 @@ def process_document(
         return action
 
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    target_path.write_text(
-        json.dumps(output, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    _write_atomic(target_path, _dump_published(output, stdlib_only=parsed_by_stdlib))
     logger.info("%s: %s", action, target_path.name)
     return action
 
 
+# Schema for documents published in a worker process; set once per worker by the initializer.
+_worker_schema: dict[str, Any] | None = None
+
+
+def _init_publish_worker(schema: dict[str, Any]) -> None:
+    global _worker_schema
+    _worker_schema = schema
+
+
+def _run_publish_task(
+    task: tuple[Path, Path, bool, bool], schema: dict[str, Any]
+) -> tuple[str | None, Exception | None]:
+    source_path, target_path, dry_run, force = task
+    try:
+        status = process_document(
+            source_path=source_path,
+            target_path=target_path,
+            schema=schema,
+            dry_run=dry_run,
+            force=force,
+        )
+        return status, None
+    except Exception as exc:
+        return None, exc
+
+
+def _publish_task_in_worker(task: tuple[Path, Path, bool, bool]) -> tuple[str | None, Exception | None]:
+    return _run_publish_task(task, _worker_schema or {})
+
+
 def publish_forarbete(
     config_path: str | None = None,
     dry_run: bool = False,
     sample: int | None = None,
     force: bool = False,
+    workers: int = 1,
 ) -> dict[str, int]:
     cfg, _ = load_config(config_path)
     schema = load_schema(cfg.schema_path)
@@ -376,13 +581,13 @@ def publish_forarbete(
     if not cfg.norm_dir.exists():
         raise FileNotFoundError(f"norm_dir does not exist: {cfg.norm_dir}")
 
-    norm_files = sorted(cfg.norm_dir.rglob("*.json"))
-    if sample is not None:
+    if sample is None:
+        found = list(_iter_json_files(cfg.norm_dir))
+    else:
         if sample < 0:
             raise ValueError("sample must be >= 0")
-        if sample < len(norm_files):
-            norm_files = random.sample(norm_files, sample)
-            norm_files = sorted(norm_files)
+        found = _reservoir_sample(_iter_json_files(cfg.norm_dir), sample)
+    norm_files = [Path(path) for path in sorted(found, key=_path_sort_key)]
 
     if not dry_run:
         cfg.published_dir.mkdir(parents=True, exist_ok=True)
@@ -395,30 +600,45 @@ def publish_forarbete(
         "failed": 0,
     }
 
-    batches = _chunked(norm_files, max(cfg.batch_size, 1))
-    for batch in batches:
-        for source_path in batch:
-            try:
-                relative = source_path.relative_to(cfg.norm_dir)
-                target_path = cfg.published_dir / relative
-                status = process_document(
-                    source_path=source_path,
-                    target_path=target_path,
-                    schema=schema,
-                    dry_run=dry_run,
-                    force=force,
-                )
-                results[status] += 1
-            except (ValidationError, ExtractionError, json.JSONDecodeError, FileNotFoundError) as exc:
-                results["failed"] += 1
-                logger.error("Failed processing %s: %s", source_path, exc)
-            except Exception as exc:  # pragma: no cover - safety net
-                results["failed"] += 1
-                logger.error("Unexpected failure in %s: %s", source_path, exc)
-
-            if results["failed"] > 100:
-                logger.critical("Aborting publish run: failure threshold exceeded (%s)", results["failed"])
-                raise PublishAbortError("Exceeded failure threshold (>100)", results)
+    # Each document is independent (own source and target file), so with workers > 1 the
+    # batches are mapped over a process pool; results come back in file order either way.
+    workers = max(1, min(workers, len(norm_files)))
+    pool_context = (
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_publish_worker, initargs=(schema,)
+        )
+        if workers > 1
+        else nullcontext()
+    )
+    with pool_context as pool:
+        batches = _chunked(norm_files, max(cfg.batch_size, 1))
+        for batch in batches:
+            tasks = [
+                (source_path, cfg.published_dir / source_path.relative_to(cfg.norm_dir), dry_run, force)
+                for source_path in batch
+            ]
+            if pool is not None:
+                outcomes = pool.map(_publish_task_in_worker, tasks)
+            else:
+                outcomes = (_run_publish_task(task, schema) for task in tasks)
+
+            for source_path, (status, exc) in zip(batch, outcomes):
+                if exc is None:
+                    results[status] += 1
+                elif isinstance(
+                    exc, (ValidationError, ExtractionError, json.JSONDecodeError, FileNotFoundError)
+                ):
+                    results["failed"] += 1
+                    logger.error("Failed processing %s: %s", source_path, exc)
+                else:  # pragma: no cover - safety net
+                    results["failed"] += 1
+                    logger.error("Unexpected failure in %s: %s", source_path, exc)
+
+                if results["failed"] > 100:
+                    logger.critical("Aborting publish run: failure threshold exceeded (%s)", results["failed"])
+                    if pool is not None:
+                        pool.shutdown(cancel_futures=True)
+                    raise PublishAbortError("Exceeded failure threshold (>100)", results)
 
     if results["failed"] > 0:
         raise PublishPartialFailureError("Publish completed with partial failures", results)
@@ -431,6 +651,9 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--dry-run", action="store_true", help="Run without writing output files")
     parser.add_argument("--sample", type=int, default=None, help="Process a random sample of files")
     parser.add_argument("--force", action="store_true", help="Write files even if idempotency hash matches")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of parallel processes (default 1 = sequential)"
+    )
     return parser
 
 
@@ -444,6 +667,7 @@ def main(argv: list[str] | None = None) -> int:
             dry_run=args.dry_run,
             sample=args.sample,
             force=args.force,
+            workers=args.workers,
         )
         return 0
     except PublishPartialFailureError:
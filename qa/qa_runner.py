@@ -7,6 +7,8 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -14,6 +16,11 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from rag.rag_pipeline import RagPipeline
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - exercised only when orjson is missing
+    orjson = None
+
 logger = logging.getLogger("paragrafenai.noop")
 
 _SOURCE_TYPE_INDICATORS = {
@@ -23,7 +30,7 @@ _SOURCE_TYPE_INDICATORS = {
     "doktrin": ",",
 }
 
-_SWEDISH_MARKERS = {
+_SWEDISH_MARKERS = frozenset({
     "och",
     "att",
     "det",
@@ -45,7 +52,17 @@ _SWEDISH_MARKERS = {
     "denna",
     "en",
     "ett",
-}
+})
+
+# A marker word counts only as a whole token, i.e. not adjacent to another letter of the
+# former token class [A-Za-zÅÄÖåäö].
+_MARKER_RE = re.compile(
+    r"(?<![A-Za-zÅÄÖåäö])(?:"
+    + "|".join(sorted(_SWEDISH_MARKERS, key=lambda word: (-len(word), word)))
+    + r")(?![A-Za-zÅÄÖåäö])"
+)
+_SV_CHARS = frozenset("åäö")
+_SOURCE_SEPARATOR = "\x00"
 
 
 @dataclass
@@ -69,32 +86,49 @@ class QaReport:
 
 
 class QaRunner:
-    def __init__(self, gold_standard_path: str, pipeline: RagPipeline) -> None:
+    def __init__(
+        self, gold_standard_path: str, pipeline: RagPipeline, max_workers: int = 1
+    ) -> None:
         self.gold_standard_path = Path(gold_standard_path)
         self.pipeline = pipeline
+        self.max_workers = max(1, max_workers)
         self.test_cases = self._load_gold_standard(self.gold_standard_path)
 
     @staticmethod
     def _load_gold_standard(path: Path) -> list[dict[str, Any]]:
-        with path.open(encoding="utf-8") as fh:
-            payload = json.load(fh)
+        raw = path.read_bytes()
+        if orjson is None:
+            payload = json.loads(raw.decode("utf-8"))
+        else:
+            try:
+                payload = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson är striktare (NaN, heltal över 64 bitar); låt stdlib avgöra.
+                payload = json.loads(raw.decode("utf-8"))
 
         if not isinstance(payload, list):
             raise ValueError("gold_standard.json måste innehålla en lista av testfall")
         return payload
 
     def run_all(self) -> QaReport:
-        results = [self._run_one(test_case) for test_case in self.test_cases]
+        # Testfallen är oberoende och väntar mest på embedder, ChromaDB och LLM-anropet, så med
+        # max_workers > 1 körs de i trådar; map() behåller testfallens ordning i rapporten.
+        embeddings = self._embed_all_queries()
+        if self.max_workers > 1 and len(self.test_cases) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(self._run_one, self.test_cases, embeddings))
+        else:
+            results = [
+                self._run_one(test_case, embedding)
+                for test_case, embedding in zip(self.test_cases, embeddings)
+            ]
 
         total = len(results)
-        passed = sum(1 for result in results if result.passed)
-        failed = total - passed
-
-        failures_by_category: dict[str, int] = {}
-        for result in results:
-            if result.passed:
-                continue
-            failures_by_category[result.category] = failures_by_category.get(result.category, 0) + 1
+        failures_by_category: dict[str, int] = dict(
+            Counter(result.category for result in results if not result.passed)
+        )
+        failed = sum(failures_by_category.values())
+        passed = total - failed
 
         pass_rate = passed / total if total else 0.0
 
@@ -107,8 +141,24 @@ class QaRunner:
             failures_by_category=failures_by_category,
         )
 
-    def _run_one(self, tc: dict[str, Any]) -> TestResult:
-        response = self.pipeline.query(tc["query"])
+    def _embed_all_queries(self) -> list[list[float] | None]:
+        """Embed every test query in one batch when the pipeline supports it.
+
+        Falls back to None per case (the pipeline embeds each query itself) if the pipeline
+        has no embed_queries or the batch does not yield one vector per query.
+        """
+        embed_queries = getattr(self.pipeline, "embed_queries", None)
+        if embed_queries is not None and self.test_cases:
+            vectors = embed_queries([tc["query"] for tc in self.test_cases])
+            if len(vectors) == len(self.test_cases):
+                return list(vectors)
+        return [None] * len(self.test_cases)
+
+    def _run_one(self, tc: dict[str, Any], query_embedding: list[float] | None = None) -> TestResult:
+        if query_embedding is None:
+            response = self.pipeline.query(tc["query"])
+        else:
+            response = self.pipeline.query(tc["query"], query_embedding=query_embedding)
 
         failures: list[str] = []
         exp = tc["expected"]
@@ -133,24 +183,35 @@ class QaRunner:
         if exp.get("disclaimer_present") and not expected_blocked and "⚠️" not in answer:
             failures.append("disclaimer saknas i answer")
 
-        sources = _as_string_list(response.get("sources", []))
-
-        for ref in exp.get("must_contain_refs", []):
-            if not any(ref in source for source in sources):
+        required_refs = exp.get("must_contain_refs", [])
+        # Blockerade och low_confidence-fall kontrollerar inte källtyper; utan krävda referenser
+        # behöver sources då inte byggas alls (typiskt för alla blockerade testfall).
+        source_types = (
+            exp.get("source_types_present", [])
+            if not expected_blocked and not expected_low_confidence
+            else []
+        )
+        sources: list[str] = []
+        sources_blob = ""
+        if required_refs or source_types:
+            sources = _as_string_list(response.get("sources", []))
+            sources_blob = _SOURCE_SEPARATOR.join(sources)
+
+        for ref in required_refs:
+            if not _in_any_source(ref, sources, sources_blob):
                 failures.append(f"källreferens saknas: {ref}")
 
         for forbidden in exp.get("must_not_contain", []):
             if forbidden in answer:
                 failures.append(f"förbjuden sträng i svar: {forbidden}")
 
-        if not expected_blocked and not expected_low_confidence:
-            for source_type in exp.get("source_types_present", []):
-                indicator = _SOURCE_TYPE_INDICATORS.get(source_type, source_type)
-                if not any(indicator in source for source in sources):
-                    failures.append(
-                        "source_type saknas: "
-                        f"{source_type} (letar efter '{indicator}' i sources)"
-                    )
+        for source_type in source_types:
+            indicator = _SOURCE_TYPE_INDICATORS.get(source_type, source_type)
+            if not _in_any_source(indicator, sources, sources_blob):
+                failures.append(
+                    "source_type saknas: "
+                    f"{source_type} (letar efter '{indicator}' i sources)"
+                )
 
         return TestResult(
             id=tc["id"],
@@ -170,13 +231,27 @@ def _as_string_list(value: Any) -> list[str]:
     return []
 
 
-def _is_probably_swedish(text: str) -> bool:
-    tokens = re.findall(r"[A-Za-zÅÄÖåäö]+", text.lower())
-    if not tokens:
+def _in_any_source(needle: str, sources: list[str], sources_blob: str) -> bool:
+    """True if needle is a substring of some source; sources_blob is the sources joined by NUL.
+
+    A needle without NUL cannot span two sources in the blob, so one C-level search replaces
+    a Python loop over all sources.
+    """
+    if not sources:
         return False
-    marker_count = sum(1 for token in tokens if token in _SWEDISH_MARKERS)
-    has_swedish_chars = any(char in text.lower() for char in "åäö")
-    return marker_count >= 2 or has_swedish_chars
+    if _SOURCE_SEPARATOR in needle:
+        return any(needle in source for source in sources)
+    return needle in sources_blob
+
+
+def _is_probably_swedish(text: str) -> bool:
+    text_lower = text.lower()
+    # å/ä/ö räcker som bevis (och ger alltid minst en token), så markörräkningen behövs bara utan dem.
+    if not _SV_CHARS.isdisjoint(text_lower):
+        return True
+    # Två markörord räcker; sökningen avbryts vid det andra i stället för att tokenisera allt.
+    markers = _MARKER_RE.finditer(text_lower)
+    return next(markers, None) is not None and next(markers, None) is not None
 
 
 def _print_report(report: QaReport) -> None:
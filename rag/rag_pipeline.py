@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -68,11 +70,25 @@ def _extract_source_ref(chunk: dict) -> str | None:
     return meta.get("namespace") or None
 
 
-def _build_context(chunks: list[dict]) -> str:
-    """Bygg en kontextsträng av chunks för LLM-prompten."""
+@lru_cache(maxsize=4)
+def _shared_anthropic_client(client_cls: type, api_key: str) -> anthropic.Anthropic:
+    """En klient per (klientklass, API-nyckel) delas av alla pipelines, så httpx-poolens
+    keep-alive-anslutningar återanvänds i stället för att varje instans gör egen TCP/TLS-
+    handskakning. Klassen ingår i nyckeln så att en patchad anthropic.Anthropic (tester)
+    aldrig återanvänds när patchen är borta."""
+    return client_cls(api_key=api_key)
+
+
+def _build_context(chunks: list[dict], refs: list[str | None] | None = None) -> str:
+    """Bygg en kontextsträng av chunks för LLM-prompten.
+
+    refs är chunkens redan extraherade källreferenser (samma ordning); saknas de räknas de fram här.
+    """
+    if refs is None:
+        refs = [_extract_source_ref(chunk) for chunk in chunks]
     parts: list[str] = []
-    for i, chunk in enumerate(chunks, start=1):
-        source_ref = _extract_source_ref(chunk) or f"källa {i}"
+    for i, (chunk, ref) in enumerate(zip(chunks, refs), start=1):
+        source_ref = ref or f"källa {i}"
         text = chunk.get("text", "").strip()
         parts.append(f"[{i}] {source_ref}\n{text}")
     return "\n\n".join(parts)
@@ -113,7 +129,7 @@ class RagPipeline:
                 "Miljövariabeln ANTHROPIC_API_KEY saknas. "
                 "Sätt den innan RagPipeline instansieras."
             )
-        self._anthropic = anthropic.Anthropic(api_key=api_key)
+        self._anthropic = _shared_anthropic_client(anthropic.Anthropic, api_key)
 
         logger.debug("RagPipeline initialiserad med modell=%s top_k=%d", self._llm_model, self._top_k)
 
@@ -123,19 +139,54 @@ class RagPipeline:
             return str(candidate)
         return str(self._repo_root / candidate)
 
+    def _query_collection(
+        self,
+        collection: str,
+        query_vector: list[float],
+        n_results: int,
+        where: dict | None,
+    ) -> list[dict]:
+        """Hämta råchunks från en collection; fel loggas och ger en tom lista."""
+        try:
+            documents, metadatas, distances = self._vector_store.query(
+                collection_name=collection,
+                query_embedding=query_vector,
+                n_results=n_results,
+                where_filter=where,
+            )
+            return [
+                {"text": text, "metadata": meta, "distance": dist}
+                for text, meta, dist in zip(documents, metadatas, distances)
+            ]
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("VectorStore query misslyckades för %s: %s", collection, exc)
+            return []
+
     # ------------------------------------------------------------------
     # Publik metod
     # ------------------------------------------------------------------
 
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Embedda flera frågor i ett anrop (t.ex. en hel QA-körning).
+
+        Vektorerna kan skickas till query() via query_embedding. Tom lista vid embeddingfel.
+        """
+        return self._embedder.embed(queries)
+
     def query(
         self,
         user_query: str,
         legal_area: str | None = None,
         top_k: int | None = None,
+        query_embedding: list[float] | None = None,
     ) -> dict:
         """
         Kör hela RAG-pipeline för en användarfråga.
 
+        query_embedding: redan beräknad vektor för user_query (från embed_queries);
+        steg 2 hoppas då över.
+
         Returnerar ett dict med nycklarna:
             answer, blocked, blocked_message, sources,
             confidence, chunks_used, low_confidence
@@ -157,30 +208,28 @@ class RagPipeline:
             }
 
         # ── Steg 2: embedding ────────────────────────────────────────
-        query_vector: list[float] = self._embedder.embed_single(user_query)
+        query_vector: list[float] = (
+            query_embedding if query_embedding else self._embedder.embed_single(user_query)
+        )
 
         # ── Steg 3: hämta råchunks från alla collections ─────────────
         where: dict | None = None
         if legal_area:
             where = {"legal_area": {"$contains": legal_area}}
 
+        # Collections frågas oberoende av varandra; med flera körs de samtidigt i trådar.
+        # map() behåller collection-ordningen, så råchunks kommer i samma ordning som förut.
+        def query_collection(collection: str) -> list[dict]:
+            return self._query_collection(collection, query_vector, effective_top_k, where)
+
         raw_chunks: list[dict] = []
-        for collection in self._collections:
-            try:
-                documents, metadatas, distances = self._vector_store.query(
-                    collection_name=collection,
-                    query_embedding=query_vector,
-                    n_results=effective_top_k,
-                    where_filter=where,
-                )
-                for text, meta, dist in zip(documents, metadatas, distances):
-                    raw_chunks.append({
-                        "text": text,
-                        "metadata": meta,
-                        "distance": dist,
-                    })
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("VectorStore query misslyckades för %s: %s", collection, exc)
+        if len(self._collections) > 1:
+            with ThreadPoolExecutor(max_workers=len(self._collections)) as executor:
+                for chunks in executor.map(query_collection, self._collections):
+                    raw_chunks.extend(chunks)
+        else:
+            for collection in self._collections:
+                raw_chunks.extend(query_collection(collection))
 
         # ── Steg 4: omrangordna ──────────────────────────────────────
         reranked_chunks: list[dict] = self._norm_boost.rerank(raw_chunks)
@@ -200,14 +249,17 @@ class RagPipeline:
             }
 
         # ── Steg 6: extrahera källreferenser ─────────────────────────
+        # Referenserna tas fram en gång och återanvänds i kontexten i steg 7.
+        refs = [_extract_source_ref(chunk) for chunk in reranked_chunks]
         sources: list[str] = []
-        for chunk in reranked_chunks:
-            ref = _extract_source_ref(chunk)
-            if ref and ref not in sources:
+        seen_refs: set[str] = set()
+        for ref in refs:
+            if ref and ref not in seen_refs:
+                seen_refs.add(ref)
                 sources.append(ref)
 
         # ── Steg 7: bygg LLM-prompt ──────────────────────────────────
-        context = _build_context(reranked_chunks)
+        context = _build_context(reranked_chunks, refs)
         user_message = (
             f"KÄLLOR:\n{context}\n\n"
             f"FRÅGA: {user_query}"
@@ -1,3 +1,5 @@
+import re
+
 from normalize.klarsprak_layer import KlarsprakLayer
 
 
@@ -61,3 +63,18 @@ def test_heading_not_injected_for_short_answer():
     layer = KlarsprakLayer(config_dir="config")
     result = layer.process(short_answer, query="", legal_area="hyresrätt")
     assert not result.startswith("#")
+
+
+def test_split_affixes_matches_regex_semantics():
+    layer = KlarsprakLayer(config_dir="config")
+    pattern = re.compile(r"^(\s*)(.*?)([.!?]*)$", flags=re.DOTALL)
+    chunks = ["", "   ", " \n", "Text.", "  Text utan punkt", " Fråga?!", "Rad\n", " Slut.\n", "...", " a.b. "]
+    for chunk in chunks:
+        assert layer._split_affixes(chunk) == pattern.match(chunk).groups()
+
+
+def test_leading_punctuation_is_preserved():
+    layer = KlarsprakLayer(config_dir="config")
+    text = "... " + " ".join(["ord"] * 45) + ", och slut."
+    result = layer.process(text, query="", legal_area=None)
+    assert result.startswith("... ")
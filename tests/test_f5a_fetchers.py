@@ -176,6 +176,180 @@ def test_sou_fetcher_logs_error_and_continues_on_http_failure(tmp_path: Path) ->
     assert any(entry.get("dok_id") == "BAD1" for entry in entries)
 
 
+def test_sou_fetcher_retries_same_name_entry_after_failed_fetch(tmp_path: Path) -> None:
+    for workers in (1, 4):
+        run_dir = tmp_path / f"workers_{workers}"
+        run_dir.mkdir()
+        config_path = _write_sources_config(run_dir)
+        config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        config["rate_limiting"]["max_concurrent_documents"] = workers
+        config_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+
+        documents = [
+            {"beteckning": "SOU 2020:1", "dok_id": "BAD1", "titel": "bad"},
+            {"beteckning": "SOU 2020:1", "dok_id": "GOOD1", "titel": "good"},
+            {"beteckning": "SOU 2020:1", "dok_id": "LATE1", "titel": "late"},
+        ]
+        list_page = _response(json_data=_sou_list_payload(0, documents))
+
+        def fake_get(url: str, **kwargs) -> Mock:
+            if url.endswith("/dokumentlista/"):
+                return list_page
+            dok_id = url.rsplit("/", 1)[-1]
+            if dok_id == "BAD1":
+                return _response(status_code=500)
+            return _response(text=f"<html>{dok_id}</html>", headers={"Content-Type": "text/html"})
+
+        session = Mock(spec=requests.Session)
+        session.get.side_effect = fake_get
+
+        with patch("ingest.sou_fetcher.time.sleep", return_value=None):
+            saved = sou_fetcher.fetch_sou_documents(config_path=config_path, session=session)
+
+        assert saved == 1
+        payload = json.loads((run_dir / "sou" / "SOU_2020_001.json").read_text(encoding="utf-8"))
+        assert payload["html_content"] == "<html>GOOD1</html>"
+        fetched = [call.args[0].rsplit("/", 1)[-1] for call in session.get.call_args_list[1:]]
+        assert "LATE1" not in fetched
+
+
+def test_sou_fetcher_fetches_documents_concurrently(tmp_path: Path) -> None:
+    config_path = _write_sources_config(tmp_path)
+    config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config["rate_limiting"]["max_concurrent_documents"] = 4
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+
+    documents = [
+        {"beteckning": f"SOU 2022:{index}", "dok_id": f"C{index}", "titel": f"t{index}"}
+        for index in range(1, 6)
+    ]
+    list_page = _response(json_data=_sou_list_payload(0, documents))
+
+    def fake_get(url: str, **kwargs) -> Mock:
+        if url.endswith("/dokumentlista/"):
+            return list_page
+        dok_id = url.rsplit("/", 1)[-1]
+        return _response(text=f"<html>{dok_id}</html>", headers={"Content-Type": "text/html"})
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = fake_get
+
+    with patch("ingest.sou_fetcher.time.sleep", return_value=None):
+        saved = sou_fetcher.fetch_sou_documents(config_path=config_path, session=session)
+
+    assert saved == 5
+    for index in range(1, 6):
+        payload = json.loads(
+            (tmp_path / "sou" / f"SOU_2022_{index:03d}.json").read_text(encoding="utf-8")
+        )
+        assert payload["html_content"] == f"<html>C{index}</html>"
+
+
+def test_sou_fetcher_prefetches_list_pages_concurrently(tmp_path: Path) -> None:
+    config_path = _write_sources_config(tmp_path)
+    config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config["riksdagen_api"]["sou"]["pagesize"] = 1
+    config["rate_limiting"]["max_concurrent_documents"] = 3
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+
+    def fake_get(url: str, **kwargs) -> Mock:
+        if url.endswith("/dokumentlista/"):
+            page = kwargs["params"]["p"]
+            document = {"beteckning": f"SOU 2023:{page}", "dok_id": f"P{page}"}
+            return _response(json_data=_sou_list_payload(3 - page, [document]))
+        return _response(text="<html>x</html>", headers={"Content-Type": "text/html"})
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = fake_get
+
+    with patch("ingest.sou_fetcher.time.sleep", return_value=None):
+        saved = sou_fetcher.fetch_sou_documents(config_path=config_path, session=session)
+
+    assert saved == 3
+    list_pages = sorted(
+        call.kwargs["params"]["p"]
+        for call in session.get.call_args_list
+        if call.args[0].endswith("/dokumentlista/")
+    )
+    assert list_pages == [1, 2, 3]
+
+
+def test_sou_fetcher_skips_full_download_for_binary_fallback(tmp_path: Path) -> None:
+    config_path = _write_sources_config(tmp_path)
+
+    page_1 = _response(
+        json_data=_sou_list_payload(
+            0,
+            [{"beteckning": "SOU 2021:5", "filUrl": "https://example.test/sou.pdf", "titel": "pdf"}],
+        )
+    )
+    probe = _response(headers={"Content-Type": "application/pdf"})
+    probe.status_code = 206
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = [page_1, probe]
+
+    with patch("ingest.sou_fetcher.time.sleep", return_value=None):
+        saved = sou_fetcher.fetch_sou_documents(config_path=config_path, session=session)
+
+    assert saved == 1
+    assert session.get.call_count == 2
+    assert session.get.call_args.kwargs["headers"]["Range"] == "bytes=0-2047"
+    probe.close.assert_called_once()
+    payload = json.loads((tmp_path / "sou" / "SOU_2021_005.json").read_text(encoding="utf-8"))
+    assert payload["html_available"] is False
+    assert payload["source_url"] == "https://example.test/sou.pdf"
+
+
+def test_sou_fetcher_does_not_probe_fallback_without_binary_extension(tmp_path: Path) -> None:
+    config_path = _write_sources_config(tmp_path)
+
+    page_1 = _response(
+        json_data=_sou_list_payload(
+            0,
+            [{"beteckning": "SOU 2021:6", "filUrl": "https://example.test/fil/ABC", "titel": "html"}],
+        )
+    )
+    full = _response(text="<html>fallback</html>", headers={"Content-Type": "text/html"})
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = [page_1, full]
+
+    with patch("ingest.sou_fetcher.time.sleep", return_value=None):
+        saved = sou_fetcher.fetch_sou_documents(config_path=config_path, session=session)
+
+    assert saved == 1
+    assert session.get.call_count == 2
+    assert "Range" not in session.get.call_args.kwargs["headers"]
+    payload = json.loads((tmp_path / "sou" / "SOU_2021_006.json").read_text(encoding="utf-8"))
+    assert payload["html_content"] == "<html>fallback</html>"
+
+
+def test_sou_request_retry_honours_retry_after() -> None:
+    throttled = Mock()
+    throttled.status_code = 429
+    throttled.headers = {"Retry-After": "7"}
+    throttled.raise_for_status.side_effect = requests.HTTPError("HTTP 429", response=throttled)
+    ok = _response(text="<html>ok</html>")
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = [throttled, ok]
+
+    with patch("ingest.sou_fetcher.time.sleep", return_value=None) as sleep:
+        response = sou_fetcher._request_with_retry(
+            session,
+            url="https://example.test/dokument/A1",
+            headers={},
+            params=None,
+            timeout=30,
+            max_retries=3,
+            retry_backoff_base_s=1.0,
+        )
+
+    assert response is ok
+    sleep.assert_called_once_with(7.0)
+
+
 def test_normalize_sou_beteckning() -> None:
     assert sou_fetcher.normalize_sou_beteckning("SOU 2017:14") == "SOU_2017_014"
 
@@ -139,6 +139,52 @@ def test_text_cleaning_removes_nav_and_script_content() -> None:
     assert "window.BAD" not in combined_text
 
 
+def test_text_cleaning_keeps_words_around_inline_removed_elements_apart() -> None:
+    parser = ForarbeteParser()
+    html = f"""
+    <html><body>
+      <h2>6. Rensning</h2>
+      <p>Hello<script>x</script>world {_words("inline", 80)}</p>
+      <p>före<span class="nav">meny</span>efter {_words("nav", 80)}</p>
+    </body></html>
+    """
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    combined_text = "\n".join(chunk["text"] for chunk in parsed["chunks"])
+    assert "Hello world" in combined_text
+    assert "före efter" in combined_text
+    assert "Helloworld" not in combined_text
+    assert "föreefter" not in combined_text
+
+
+def test_removed_top_level_div_does_not_count_as_page() -> None:
+    parser = ForarbeteParser()
+    pages = "".join(f"<div><p>{_words(f'sida{page}x', 20)}</p></div>" for page in range(1, 11))
+    html = f'<html><body><div class="nav">Meny</div>{pages}</body></html>'
+
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    assert parsed["chunks"][0]["pinpoint"] == "s. 1"
+    assert [chunk["pinpoint"] for chunk in parsed["chunks"]] == [f"s. {page}" for page in range(1, 11)]
+
+    nine_pages = "".join(f"<div><p>{_words(f'sida{page}x', 20)}</p></div>" for page in range(1, 10))
+    html = f'<html><body><div class="nav">Meny</div>{nine_pages}</body></html>'
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    assert all(chunk["section_title"].endswith("...") for chunk in parsed["chunks"])
+
+
+def test_parser_accepts_html_with_xml_encoding_declaration() -> None:
+    parser = ForarbeteParser()
+    html = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f"<html><body><h2>7. Deklaration</h2><p>{_words('decl', 80)}</p></body></html>"
+    )
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    assert parsed["chunks"][0]["section_title"] == "7. Deklaration"
+
+
 def test_legal_area_normalizer_keeps_unknown_and_maps_alias() -> None:
     normalizer = LegalAreaNormalizer()
     normalized = normalizer.normalize(["AvtL", "specialområde"])
@@ -146,6 +192,23 @@ def test_legal_area_normalizer_keeps_unknown_and_maps_alias() -> None:
     assert "specialområde" in normalized
 
 
+def test_legal_area_normalizer_normalize_many_matches_normalize(tmp_path: Path) -> None:
+    config_path = tmp_path / "legal_areas.yaml"
+    config_path.write_text(
+        "legal_areas:\n"
+        "  - id: avtalsrätt\n"
+        "    aliases: [AvtL, avtalslagen]\n"
+        "  - id: straffrätt\n"
+        "    excluded: true\n",
+        encoding="utf-8",
+    )
+    normalizer = LegalAreaNormalizer(config_path=config_path)
+    batches = [["AvtL", "specialområde", "avtalsrätt"], [], ["  AVTALSLAGEN ", "Straffrätt"]]
+
+    assert normalizer.normalize_many(batches) == [normalizer.normalize(batch) for batch in batches]
+    assert normalizer.normalize_many(batches)[2] == ["avtalsrätt", "straffrätt"]
+
+
 def test_is_excluded_matches_config() -> None:
     normalizer = LegalAreaNormalizer()
     assert normalizer.is_excluded("straffrätt") is True
@@ -61,6 +61,28 @@ def test_paragraf_number_extraction_alphanumeric() -> None:
     assert parsed["chunks"][0]["paragraf_nr"] == "1a"
 
 
+def test_only_newline_characters_split_lines() -> None:
+    parser = SfsParser()
+    html = "<html><body><pre>1 § Första paragrafen text.\x0c2 § Andra paragrafen text.</pre></body></html>"
+
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    assert [chunk["paragraf_nr"] for chunk in parsed["chunks"]] == ["1"]
+
+
+def test_chapter_heading_after_form_feed() -> None:
+    parser = SfsParser()
+    html = (
+        "<html><body><pre>1 kap. Inledning\n1 § Första paragrafen text.\x0c"
+        "2 kap. Adoption\n7 § Adoption får ske under vissa villkor.</pre></body></html>"
+    )
+
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    chapters = [(chunk["paragraf_nr"], chunk["kapitel_nr"], chunk["kapitel_titel"]) for chunk in parsed["chunks"]]
+    assert chapters == [("1", "1", "Inledning"), ("7", "2", "Adoption")]
+
+
 def test_chapter_identification() -> None:
     parser = SfsParser()
     html = """
@@ -147,6 +169,24 @@ def test_transition_heading_is_used_as_kapitel_titel() -> None:
     assert parsed["chunks"][1]["kapitel_titel"] == "Övergångsbestämmelser"
 
 
+def test_chapter_heading_variants() -> None:
+    parser = SfsParser()
+    html = """
+    <html><body>
+      <p>Kapitel 3. Arv</p>
+      <p>1 § Första.</p>
+      <p>KAP. 4</p>
+      <p>2 § Andra.</p>
+    </body></html>
+    """
+
+    parsed = parser.parse(_raw_doc(html))
+    assert parsed is not None
+    chunks = parsed["chunks"]
+    assert (chunks[0]["kapitel_nr"], chunks[0]["kapitel_titel"]) == ("3", "Arv")
+    assert (chunks[1]["kapitel_nr"], chunks[1]["kapitel_titel"]) == ("4", None)
+
+
 def test_source_id_is_deterministic_for_same_sfs_number() -> None:
     first = SfsIndexer.build_source_id("1949:381")
     second = SfsIndexer.build_source_id("1949:381")
@@ -154,3 +194,14 @@ def test_source_id_is_deterministic_for_same_sfs_number() -> None:
 
     assert first == second
     assert first != third
+
+
+def test_parse_many_matches_parse_per_document() -> None:
+    parser = SfsParser()
+    docs = [
+        _raw_doc("<html><body><p>1 § Första.</p></body></html>"),
+        _raw_doc("<html><body><p>1 § Ej tillgänglig.</p></body></html>", html_available=False),
+        _raw_doc("<html><body><p>2 § Andra.</p><p>3 § Tredje.</p></body></html>"),
+    ]
+
+    assert list(parser.parse_many(docs)) == [parser.parse(doc) for doc in docs]
@@ -191,3 +191,79 @@ def test_run_all_builds_correct_report_metrics(tmp_path):
     assert report.failed == 1
     assert report.pass_rate == 0.5
     assert report.failures_by_category == {"kategori_b": 1}
+
+
+def test_run_all_with_threads_keeps_test_case_order(tmp_path):
+    cases = [
+        _make_test_case(f"gs_1{idx:02d}", f"kategori_{idx % 2}", _make_expected(blocked=idx % 2 == 0))
+        for idx in range(6)
+    ]
+    gold_path = _write_gold_standard(tmp_path, cases)
+    pipeline = DummyPipeline()
+
+    def fake_query(user_query: str) -> dict:
+        return {"answer": "Frågan är blockerad.", "blocked": True, "low_confidence": False, "sources": []}
+
+    runner = QaRunner(str(gold_path), pipeline, max_workers=4)
+    with patch.object(pipeline, "query", side_effect=fake_query):
+        report = runner.run_all()
+
+    assert [result.id for result in report.results] == [case["id"] for case in cases]
+    assert report.passed == 3
+    assert report.failures_by_category == {"kategori_1": 3}
+
+
+def test_run_all_embeds_queries_in_one_batch(tmp_path):
+    cases = [_make_test_case(f"gs_2{idx:02d}", "kategori", _make_expected(blocked=True)) for idx in range(3)]
+    gold_path = _write_gold_standard(tmp_path, cases)
+
+    class EmbeddingPipeline:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+            self.calls: list[tuple[str, list[float] | None]] = []
+
+        def embed_queries(self, queries: list[str]) -> list[list[float]]:
+            self.batches.append(queries)
+            return [[float(idx)] for idx in range(len(queries))]
+
+        def query(self, user_query: str, query_embedding: list[float] | None = None) -> dict:
+            self.calls.append((user_query, query_embedding))
+            return {"answer": "Frågan är blockerad.", "blocked": True, "sources": []}
+
+    pipeline = EmbeddingPipeline()
+    report = QaRunner(str(gold_path), pipeline).run_all()
+
+    assert report.passed == 3
+    assert pipeline.batches == [[case["query"] for case in cases]]
+    assert pipeline.calls == [(case["query"], [float(idx)]) for idx, case in enumerate(cases)]
+
+
+def test_load_gold_standard_accepts_stdlib_only_json_and_rejects_non_list(tmp_path):
+    target = tmp_path / "gold_standard.json"
+    target.write_text('[{"id": "QA-001", "score": NaN}]', encoding="utf-8")
+    loaded = QaRunner._load_gold_standard(target)
+    assert loaded[0]["id"] == "QA-001"
+
+    target.write_text('{"id": "QA-001"}', encoding="utf-8")
+    try:
+        QaRunner._load_gold_standard(target)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for non-list payload")
+
+
+def test_run_one_blocked_case_still_checks_answer_but_not_sources(tmp_path):
+    expected = _make_expected(
+        blocked=True,
+        source_types_present=["sfs"],
+        must_not_contain=["Enligt"],
+    )
+    gold_path = _write_gold_standard(tmp_path, [_make_test_case("QA-020", "blocked", expected)])
+    runner = QaRunner(gold_path, DummyPipeline())
+
+    response = {"blocked": True, "answer": "Enligt reglerna kan frågan inte besvaras.", "sources": None}
+    with patch.object(runner.pipeline, "query", return_value=response):
+        result = runner._run_one(runner.test_cases[0])
+
+    assert result.failures == ["förbjuden sträng i svar: Enligt"]
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from pathlib import Path
 
@@ -10,6 +11,7 @@ from publish.forarbete_publish import (
     extract_sou_number,
     generate_source_id,
     publish_forarbete,
+    sha256_of_norm,
 )
 
 
@@ -126,6 +128,13 @@ def test_source_id_uniqueness():
     assert generate_source_id("SOU 2023:45") != generate_source_id("SOU 2023:46")
 
 
+def test_sha256_of_norm_matches_canonical_json():
+    """Strömmad hash == hash av json.dumps(sort_keys=True) (idempotensnyckeln får inte ändras)."""
+    doc = _minimal_doc(title="Åtgärder för öppenhet")
+    canonical = json.dumps(doc, sort_keys=True, ensure_ascii=False)
+    assert sha256_of_norm(doc) == hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def test_title_extraction_priority(tmp_path: Path):
     """metadata["title"] > metadata["titel"] > front_page_text > fallback."""
     config_path, norm_dir, published_dir = _setup(tmp_path)
@@ -189,6 +198,21 @@ def test_idempotency_on_change(tmp_path: Path):
     assert second["updated"] == 1
 
 
+def test_idempotency_truncated_published_file_is_rewritten(tmp_path: Path):
+    """Avbruten skrivning av published-fil -> hashen i filhuvudet räcker inte, filen skrivs om."""
+    config_path, norm_dir, published_dir = _setup(tmp_path)
+    _write_json(norm_dir / "sou_2023_45.json", _minimal_doc())
+    publish_forarbete(config_path=str(config_path))
+
+    published = published_dir / "sou_2023_45.json"
+    content = published.read_text(encoding="utf-8")
+    published.write_text(content[: len(content) // 2], encoding="utf-8")
+
+    results = publish_forarbete(config_path=str(config_path))
+    assert results["updated"] == 1
+    assert json.loads(published.read_text(encoding="utf-8"))["front_matter"]["norm_sha256"]
+
+
 def test_partial_run_recovery(tmp_path: Path):
     """Simulera avbruten körning -> omstart ger korrekt resultat."""
     config_path, norm_dir, published_dir = _setup(tmp_path)
@@ -279,4 +303,71 @@ def test_published_dir_created_if_missing(tmp_path: Path):
     assert not published_dir.exists()
     publish_forarbete(config_path=str(config_path))
     assert published_dir.exists()
+    assert not list(published_dir.glob("*.tmp"))
+
+
+def test_non_finite_numbers_survive_publish(tmp_path: Path):
+    """NaN/Infinity i norm-filen -> skrivs som NaN/Infinity, inte null."""
+    config_path, norm_dir, published_dir = _setup(tmp_path)
+    doc = _minimal_doc()
+    doc["body"].append({"type": "table", "values": [float("nan"), float("inf"), None]})
+    _write_json(norm_dir / "sou_2023_45.json", doc)
 
+    publish_forarbete(config_path=str(config_path))
+    published = json.loads((published_dir / "sou_2023_45.json").read_text(encoding="utf-8"))
+    values = published["document"]["body"][1]["values"]
+    assert values[0] != values[0]
+    assert values[1] == float("inf")
+    assert values[2] is None
+
+
+def test_parallel_workers_match_sequential(tmp_path: Path):
+    """workers > 1 -> samma räkneverk och felhantering som sekventiell körning."""
+    config_path, norm_dir, published_dir = _setup(tmp_path)
+    for seq in range(45, 50):
+        _write_json(norm_dir / f"sou_2023_{seq}.json", _minimal_doc(sou_number=f"SOU 2023:{seq}"))
+    (norm_dir / "sou_2023_50.json").write_text("{invalid json", encoding="utf-8")
+
+    with pytest.raises(PublishPartialFailureError) as exc:
+        publish_forarbete(config_path=str(config_path), workers=2)
+    assert exc.value.results == {"total": 6, "created": 5, "updated": 0, "skipped": 0, "failed": 1}
+    assert len(list(published_dir.glob("*.json"))) == 5
+
+    with pytest.raises(PublishPartialFailureError) as exc:
+        publish_forarbete(config_path=str(config_path), workers=2)
+    assert exc.value.results["skipped"] == 5
+
+
+def test_sample_limits_processed_files(tmp_path: Path):
+    """--sample N -> högst N slumpvis valda filer; N >= antal filer -> alla."""
+    config_path, norm_dir, published_dir = _setup(tmp_path)
+    for seq in range(45, 50):
+        _write_json(norm_dir / f"sou_2023_{seq}.json", _minimal_doc(sou_number=f"SOU 2023:{seq}"))
+
+    sampled = publish_forarbete(config_path=str(config_path), dry_run=True, sample=2)
+    assert sampled["total"] == 2
+    assert sampled["created"] == 2
+
+    everything = publish_forarbete(config_path=str(config_path), sample=10)
+    assert everything["created"] == 5
+    assert len(list(published_dir.glob("*.json"))) == 5
+
+
+def test_simple_yaml_fallback_parses_config():
+    """Reservparsern (utan PyYAML) läser sektioner, kommentarer, citattecken och typer."""
+    from publish.forarbete_publish import _parse_simple_yaml
+
+    text = (
+        "# kommentar\n"
+        "forarbete_publish:\n"
+        '  norm_dir: "data/norm"  # inline\n'
+        "  batch_size: 25\n"
+        "  dry: True\n"
+        "ignored line\n"
+        "other:\n"
+        "  name: 'x'\n"
+    )
+    assert _parse_simple_yaml(text) == {
+        "forarbete_publish": {"norm_dir": "data/norm", "batch_size": 25, "dry": True},
+        "other": {"name": "x"},
+    }